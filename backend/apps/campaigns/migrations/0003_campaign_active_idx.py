@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0002_campaign_abtestvariant_campaignlog_campaignrecipient_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(condition=models.Q(('status__in', ['sending', 'scheduled'])), fields=['workspace', '-started_at'], name='campaign_active_idx'),
+        ),
+    ]
@@ -332,6 +332,13 @@ class Campaign(BaseModel):
     class Meta:
         db_table = 'campaigns'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['workspace', '-started_at'],
+                condition=models.Q(status__in=['sending', 'scheduled']),
+                name='campaign_active_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -14,6 +14,7 @@ from apps.campaigns.models import (
 )
 from apps.campaigns.services.template_engine import TemplateEngine
 from apps.contacts.models import Contact, ContactActivity
+from apps.core.services import ReportsService
 from apps.email_accounts.models import EmailAccount
 from apps.email_accounts.services.email_service import EmailService
 
@@ -344,6 +345,8 @@ class CampaignService:
                 "Campaign sending started"
             )
 
+        ReportsService.invalidate_cache(self.campaign.workspace_id)
+
         return True, "Campaign started"
 
     def pause_sending(self):
@@ -575,6 +578,7 @@ class CampaignService:
                     'bounced': self.campaign.bounced_count
                 }
             )
+            ReportsService.invalidate_cache(self.campaign.workspace_id)
 
     def select_ab_winner(self):
         """Select the winning A/B test variant."""
@@ -1,6 +1,7 @@
 import re
 import random
 import html
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
@@ -91,15 +92,7 @@ class TemplateEngine:
 
     def count_spintax_variations(self, text: str) -> int:
         """Calculate total number of possible spintax variations."""
-        patterns = self.extract_spintax(text)
-        if not patterns:
-            return 1
-
-        variations = 1
-        for pattern in patterns:
-            options = pattern.split('|')
-            variations *= len(options)
-        return variations
+        return _count_spintax_variations(text)
 
     def process_spintax(self, text: str, seed: Optional[int] = None) -> str:
         """
@@ -127,13 +120,15 @@ class TemplateEngine:
 
         Returns: (processed_text, variables_used, missing_variables)
         """
+        segments, slots = _compile_variables(text)
+        if not slots:
+            return text, [], []
+
         variables_used = []
         missing_variables = []
+        parts = [segments[0]]
 
-        def replace_variable(match):
-            var_name = match.group(1)
-            fallback = match.group(2)
-
+        for (var_name, fallback, placeholder), segment in zip(slots, segments[1:]):
             # Handle nested variables like custom_fields.field_name
             value = self._get_nested_value(context, var_name)
 
@@ -142,18 +137,19 @@ class TemplateEngine:
                 str_value = str(value)
                 if escape_html:
                     str_value = html.escape(str_value)
-                return str_value
+                parts.append(str_value)
             elif fallback is not None:
                 # Use fallback value
                 variables_used.append(var_name)
-                return fallback
+                parts.append(fallback)
             else:
                 # Keep original placeholder if no value and no fallback
                 missing_variables.append(var_name)
-                return match.group(0)
+                parts.append(placeholder)
 
-        processed = self.VARIABLE_PATTERN.sub(replace_variable, text)
-        return processed, list(set(variables_used)), list(set(missing_variables))
+            parts.append(segment)
+
+        return ''.join(parts), list(set(variables_used)), list(set(missing_variables))
 
     def _get_nested_value(self, context: Dict[str, Any], key: str) -> Optional[Any]:
         """Get a nested value from context using dot notation."""
@@ -365,3 +361,37 @@ class TemplateEngine:
             'campaign': self.CAMPAIGN_VARIABLES,
             'date': self.DATE_VARIABLES,
         }
+
+
+# Campaign sends render the same templates for every recipient, so the
+# parsing below is done once per distinct text
+
+@lru_cache(maxsize=128)
+def _compile_variables(text: str) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Optional[str], str], ...]]:
+    """Split template text around its variables.
+
+    Returns:
+        (segments, slots): the literal text between variables, and a
+        (name, fallback, placeholder) tuple per variable. There is always
+        one more segment than slots.
+    """
+    segments = []
+    slots = []
+    position = 0
+
+    for match in TemplateEngine.VARIABLE_PATTERN.finditer(text):
+        segments.append(text[position:match.start()])
+        slots.append((match.group(1), match.group(2), match.group(0)))
+        position = match.end()
+    segments.append(text[position:])
+
+    return tuple(segments), tuple(slots)
+
+
+@lru_cache(maxsize=128)
+def _count_spintax_variations(text: str) -> int:
+    """Total number of possible spintax variations of `text`."""
+    variations = 1
+    for pattern in TemplateEngine.SPINTAX_PATTERN.findall(text):
+        variations *= len(pattern.split('|'))
+    return variations
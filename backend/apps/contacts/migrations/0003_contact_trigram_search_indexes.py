@@ -0,0 +1,37 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# Columns covered by the ContactViewSet.search text query. Django compiles
+# ``icontains`` on PostgreSQL to ``UPPER(col::text) LIKE UPPER(%s)``, so the
+# indexes are built on that exact expression to be picked up by the planner.
+TRIGRAM_SEARCH_COLUMNS = ['email', 'first_name', 'last_name', 'company', 'job_title']
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in TRIGRAM_SEARCH_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS contact_{column}_trgm_idx '
+            f'ON contacts_contact USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in TRIGRAM_SEARCH_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS contact_{column}_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0002_scoredecayconfig_scoringrule_scorethreshold_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,45 @@
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def create_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS contact_search_vector_idx '
+        'ON contacts_contact USING gin (search_vector)'
+    )
+    schema_editor.execute(
+        'CREATE TRIGGER contact_search_vector_update '
+        'BEFORE INSERT OR UPDATE OF email, first_name, last_name, company, job_title '
+        'ON contacts_contact FOR EACH ROW EXECUTE FUNCTION '
+        "tsvector_update_trigger(search_vector, 'pg_catalog.simple', "
+        'email, first_name, last_name, company, job_title)'
+    )
+    schema_editor.execute(
+        "UPDATE contacts_contact SET search_vector = to_tsvector('pg_catalog.simple', "
+        "concat_ws(' ', email, first_name, last_name, company, job_title))"
+    )
+
+
+def drop_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP TRIGGER IF EXISTS contact_search_vector_update ON contacts_contact')
+    schema_editor.execute('DROP INDEX IF EXISTS contact_search_vector_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0003_contact_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_vector_trigger, drop_search_vector_trigger),
+    ]
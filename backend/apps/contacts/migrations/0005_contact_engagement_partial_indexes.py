@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0004_contact_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('emails_opened__gt', 0)), fields=['workspace', '-score'], name='contact_opened_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('emails_clicked__gt', 0)), fields=['workspace', '-score'], name='contact_clicked_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('emails_replied__gt', 0)), fields=['workspace', '-score'], name='contact_replied_idx'),
+        ),
+    ]
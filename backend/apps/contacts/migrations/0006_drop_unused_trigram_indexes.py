@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+# Company and job title are searched through search_vector only; their
+# trigram indexes are no longer read by any query
+UNUSED_TRIGRAM_COLUMNS = ['company', 'job_title']
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in UNUSED_TRIGRAM_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS contact_{column}_trgm_idx')
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in UNUSED_TRIGRAM_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS contact_{column}_trgm_idx '
+            f'ON contacts_contact USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0005_contact_engagement_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_trigram_indexes, create_trigram_indexes),
+    ]
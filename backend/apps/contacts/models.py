@@ -1,3 +1,4 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from apps.core.models import BaseModel
@@ -92,6 +93,11 @@ class Contact(BaseModel):
     # Notes
     notes = models.TextField(blank=True, default='')
 
+    # Full-text search document over email/name/company/job title.
+    # Maintained by a database trigger and GIN-indexed on PostgreSQL
+    # (see migration 0004); always NULL on other backends.
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         unique_together = ['email', 'workspace']
         ordering = ['-created_at']
@@ -100,6 +106,22 @@ class Contact(BaseModel):
             models.Index(fields=['workspace', 'status']),
             models.Index(fields=['workspace', 'score']),
             models.Index(fields=['workspace', '-created_at']),
+            # Partial indexes for the has_opened/has_clicked/has_replied filters
+            models.Index(
+                fields=['workspace', '-score'],
+                name='contact_opened_idx',
+                condition=models.Q(emails_opened__gt=0)
+            ),
+            models.Index(
+                fields=['workspace', '-score'],
+                name='contact_clicked_idx',
+                condition=models.Q(emails_clicked__gt=0)
+            ),
+            models.Index(
+                fields=['workspace', '-score'],
+                name='contact_replied_idx',
+                condition=models.Q(emails_replied__gt=0)
+            ),
         ]
 
     def __str__(self):
@@ -253,6 +275,23 @@ class ContactList(BaseModel):
         self.last_count_updated_at = timezone.now()
         self.save(update_fields=['contact_count', 'last_count_updated_at'])
 
+    def update_static_contact_count(self):
+        """Recount a static list's members with a single UPDATE, without reloading the list."""
+        from django.db.models import Count, OuterRef, Subquery
+        from django.db.models.functions import Coalesce
+        from django.utils import timezone
+        member_count = (
+            ContactList.contacts.through.objects
+            .filter(contactlist_id=OuterRef('id'))
+            .values('contactlist_id')
+            .annotate(total=Count('contact_id'))
+            .values('total')
+        )
+        ContactList.objects.filter(id=self.id).update(
+            contact_count=Coalesce(Subquery(member_count), 0),
+            last_count_updated_at=timezone.now()
+        )
+
 
 class ContactActivity(BaseModel):
     """Activity log for contacts."""
@@ -14,6 +14,9 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'contact_count', 'created_at', 'updated_at']
 
     def get_contact_count(self, obj):
+        # Use the contact_total annotation when the queryset provides it
+        if hasattr(obj, 'contact_total'):
+            return obj.contact_total
         return obj.contacts.count()
 
 
@@ -324,7 +327,7 @@ class ScoreThresholdSerializer(serializers.ModelSerializer):
     def get_contacts_count(self, obj):
         from .models import Contact
         queryset = Contact.objects.filter(
-            workspace=obj.workspace,
+            workspace_id=obj.workspace_id,
             status=Contact.Status.ACTIVE,
             score__gte=obj.min_score
         )
@@ -170,12 +170,14 @@ class ScoringEngine:
         if not rule.max_applications:
             return True
 
-        application_count = ScoreHistory.objects.filter(
+        # The limit is reached iff a row exists at offset max_applications - 1,
+        # which avoids counting the contact's full history for this rule
+        limit_reached = ScoreHistory.objects.filter(
             contact=contact,
             rule=rule
-        ).count()
+        )[rule.max_applications - 1:].exists()
 
-        return application_count < rule.max_applications
+        return not limit_reached
 
     def set_score(
         self,
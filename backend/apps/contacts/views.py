@@ -1,6 +1,17 @@
-from django.db.models import Q
+import json
+import re
+import uuid
+from itertools import islice
+
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
@@ -24,46 +35,135 @@ from .serializers import (
     BulkListSerializer,
     ContactSearchSerializer,
 )
-
-
-class TagViewSet(viewsets.ModelViewSet):
+from apps.core.mixins import WorkspaceViewSetMixin
+from apps.core.services import ReportsService
+from apps.core.pagination import ShortResultPageNumberPagination
+from apps.core.streaming import iter_csv_rows
+
+
+CONTACT_EXPORT_HEADER = [
+    'Email', 'First Name', 'Last Name', 'Company', 'Job Title',
+    'Phone', 'Website', 'LinkedIn', 'Twitter',
+    'City', 'State', 'Country', 'Timezone',
+    'Score', 'Status', 'Source', 'Notes',
+    'Emails Sent', 'Emails Opened', 'Emails Clicked', 'Emails Replied',
+    'Created At'
+]
+
+# Column order must match CONTACT_EXPORT_HEADER; created_at stays last.
+CONTACT_EXPORT_FIELDS = [
+    'email', 'first_name', 'last_name', 'company', 'job_title',
+    'phone', 'website', 'linkedin_url', 'twitter_handle',
+    'city', 'state', 'country', 'timezone',
+    'score', 'status', 'source', 'notes',
+    'emails_sent', 'emails_opened', 'emails_clicked', 'emails_replied',
+    'created_at'
+]
+
+# Rows per INSERT when writing M2M through tables in bulk.
+BULK_BATCH_SIZE = 1000
+
+# Number of data rows returned when previewing an uploaded import file.
+PREVIEW_ROW_LIMIT = 5
+
+# Upper bound on how much of an uploaded CSV is read to build its preview.
+PREVIEW_READ_CHARS = 64 * 1024
+
+# Word characters only, so user input can be safely fed to a raw tsquery.
+SEARCH_TERM_RE = re.compile(r'\w+')
+
+
+def _iter_json_array(f, chunk_size=65536):
+    """
+    Lazily yield the items of a top-level JSON array from a text file.
+
+    Reads the file in chunks and decodes one item at a time, so previewing
+    a large upload does not load the whole document. Yields nothing if the
+    document is not an array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    while not buffer:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        buffer = chunk.lstrip()
+    if not buffer.startswith('['):
+        return
+    buffer = buffer[1:]
+    eof = False
+
+    while True:
+        buffer = buffer.lstrip(' \t\r\n,')
+        if buffer.startswith(']'):
+            return
+        try:
+            item, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            item, end = None, None
+            if eof:
+                raise
+        # An item touching the end of the buffer may continue in the next chunk
+        if end is None or (end == len(buffer) and not eof):
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+        yield item
+        buffer = buffer[end:]
+
+
+def has_any_tag(tag_ids):
+    """EXISTS filter matching contacts that carry at least one of the given tags."""
+    return Exists(
+        Contact.tags.through.objects.filter(contact_id=OuterRef('pk'), tag_id__in=tag_ids)
+    )
+
+
+def tags_prefetch():
+    """Prefetch for Contact.tags with each tag's contact count pre-computed."""
+    # Counted in a correlated subquery: Count('contacts') here would reuse
+    # the prefetch's own join and only count the contacts being fetched
+    contact_total = Contact.tags.through.objects.filter(
+        tag_id=OuterRef('pk')
+    ).order_by().values('tag_id').annotate(total=Count('*')).values('total')
+
+    # Only the columns TagSerializer renders; deferring any of them would
+    # trigger a query per tag on access
+    return Prefetch(
+        'tags',
+        queryset=Tag.objects.only('id', 'name', 'color', 'created_at', 'updated_at')
+        .annotate(contact_total=Coalesce(Subquery(contact_total), 0))
+    )
+
+
+class TagViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
     """ViewSet for managing tags."""
 
     permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        # For now, return all tags for the user
-        # Later this will be filtered by workspace
-        return Tag.objects.all()
+    queryset = Tag.objects.annotate(contact_total=Count('contacts'))
 
     def get_serializer_class(self):
         if self.action == 'create':
             return TagCreateSerializer
         return TagSerializer
 
-    def perform_create(self, serializer):
-        # For now, we'll need to handle workspace later
-        # This is a placeholder - workspace will be required
-        workspace = self.request.user.workspaces.first()
-        if workspace:
-            serializer.save(workspace=workspace)
-
 
-class ContactViewSet(viewsets.ModelViewSet):
+class ContactViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
     """ViewSet for managing contacts."""
 
     permission_classes = [IsAuthenticated]
+    queryset = Contact.objects.all()
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['status', 'source']
     search_fields = ['email', 'first_name', 'last_name', 'company', 'job_title']
     ordering_fields = ['created_at', 'updated_at', 'email', 'score', 'last_emailed_at']
     ordering = ['-created_at']
+    pagination_class = ShortResultPageNumberPagination
 
     def get_queryset(self):
-        # For now, return all contacts for the user's workspaces
-        # Later this will be filtered by selected workspace
-        user_workspaces = self.request.user.workspaces.all()
-        return Contact.objects.filter(workspace__in=user_workspaces).prefetch_related('tags')
+        queryset = super().get_queryset()
+        return queryset.defer('search_vector').prefetch_related(tags_prefetch())
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -72,12 +172,6 @@ class ContactViewSet(viewsets.ModelViewSet):
             return ContactUpdateSerializer
         return ContactSerializer
 
-    def perform_create(self, serializer):
-        # Use the user's first workspace for now
-        workspace = self.request.user.workspaces.first()
-        if workspace:
-            serializer.save(workspace=workspace)
-
     @action(detail=False, methods=['post'])
     def search(self, request):
         """Advanced search for contacts."""
@@ -89,22 +183,15 @@ class ContactViewSet(viewsets.ModelViewSet):
 
         # Text search
         if data.get('query'):
-            query = data['query']
-            queryset = queryset.filter(
-                Q(email__icontains=query) |
-                Q(first_name__icontains=query) |
-                Q(last_name__icontains=query) |
-                Q(company__icontains=query) |
-                Q(job_title__icontains=query)
-            )
+            queryset = queryset.filter(self._text_search_filter(data['query']))
 
         # Status filter
         if data.get('status'):
             queryset = queryset.filter(status=data['status'])
 
-        # Tags filter
+        # Tags filter (EXISTS rather than a join, so rows are never duplicated)
         if data.get('tags'):
-            queryset = queryset.filter(tags__id__in=data['tags'])
+            queryset = queryset.filter(has_any_tag(data['tags']))
 
         # Score range
         if data.get('min_score') is not None:
@@ -147,7 +234,6 @@ class ContactViewSet(viewsets.ModelViewSet):
             else:
                 queryset = queryset.filter(emails_replied=0)
 
-        queryset = queryset.distinct()
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = ContactSerializer(page, many=True)
@@ -156,11 +242,46 @@ class ContactViewSet(viewsets.ModelViewSet):
         serializer = ContactSerializer(queryset, many=True)
         return Response(serializer.data)
 
+    @staticmethod
+    def _text_search_filter(query):
+        """
+        Build the filter for the free-text part of a contact search.
+
+        On PostgreSQL this matches word prefixes against the GIN-indexed
+        search_vector column, plus substring matches on email and the name
+        columns (served by their trigram indexes): the tsvector keeps an
+        address as a single token, and names should still match on any
+        part ("ohn" finds "John"). Other backends fall back to icontains
+        across the columns.
+        """
+        terms = SEARCH_TERM_RE.findall(query)
+        if connection.vendor == 'postgresql' and terms:
+            search_query = SearchQuery(
+                ' & '.join(f'{term}:*' for term in terms),
+                config='simple',
+                search_type='raw'
+            )
+            return (
+                Q(search_vector=search_query) |
+                Q(email__icontains=query) |
+                Q(first_name__icontains=query) |
+                Q(last_name__icontains=query)
+            )
+
+        return (
+            Q(email__icontains=query) |
+            Q(first_name__icontains=query) |
+            Q(last_name__icontains=query) |
+            Q(company__icontains=query) |
+            Q(job_title__icontains=query)
+        )
+
     @action(detail=True, methods=['get'])
     def activities(self, request, pk=None):
         """Get activity timeline for a contact."""
-        contact = self.get_object()
-        activities = contact.activities.all()[:100]
+        contact = get_object_or_404(self.get_queryset().prefetch_related(None).only('id'), pk=pk)
+        self.check_object_permissions(request, contact)
+        activities = contact.activities.only(*ContactActivitySerializer.Meta.fields)[:100]
         serializer = ContactActivitySerializer(activities, many=True)
         return Response(serializer.data)
 
@@ -171,11 +292,11 @@ class ContactViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
 
         contact_ids = serializer.validated_data['contact_ids']
-        queryset = self.get_queryset().filter(id__in=contact_ids)
-        count = queryset.count()
-        queryset.delete()
+        queryset = self.get_queryset().filter(id__in=contact_ids).only('id')
+        # delete() also counts cascaded rows, so report only the contacts
+        _, deleted_per_model = queryset.delete()
 
-        return Response({'deleted_count': count})
+        return Response({'deleted_count': deleted_per_model.get(Contact._meta.label, 0)})
 
     @action(detail=False, methods=['post'])
     def bulk_add_tags(self, request):
@@ -186,13 +307,32 @@ class ContactViewSet(viewsets.ModelViewSet):
         contact_ids = serializer.validated_data['contact_ids']
         tag_ids = serializer.validated_data['tag_ids']
 
-        contacts = self.get_queryset().filter(id__in=contact_ids)
-        tags = Tag.objects.filter(id__in=tag_ids)
-
-        for contact in contacts:
-            contact.tags.add(*tags)
+        contact_ids = list(
+            self.get_queryset().filter(id__in=contact_ids).values_list('id', flat=True)
+        )
+        tag_ids = list(Tag.objects.filter(id__in=tag_ids).values_list('id', flat=True))
+
+        ContactTag = Contact.tags.through
+        with transaction.atomic():
+            # Skip pairs that already exist so only genuinely new rows are inserted
+            existing = set(
+                ContactTag.objects.filter(
+                    contact_id__in=contact_ids,
+                    tag_id__in=tag_ids,
+                ).values_list('contact_id', 'tag_id')
+            )
+            ContactTag.objects.bulk_create(
+                [
+                    ContactTag(contact_id=contact_id, tag_id=tag_id)
+                    for contact_id in contact_ids
+                    for tag_id in tag_ids
+                    if (contact_id, tag_id) not in existing
+                ],
+                ignore_conflicts=True,
+                batch_size=BULK_BATCH_SIZE,
+            )
 
-        return Response({'updated_count': contacts.count()})
+        return Response({'updated_count': len(contact_ids)})
 
     @action(detail=False, methods=['post'])
     def bulk_remove_tags(self, request):
@@ -203,13 +343,17 @@ class ContactViewSet(viewsets.ModelViewSet):
         contact_ids = serializer.validated_data['contact_ids']
         tag_ids = serializer.validated_data['tag_ids']
 
-        contacts = self.get_queryset().filter(id__in=contact_ids)
-        tags = Tag.objects.filter(id__in=tag_ids)
+        contact_ids = list(
+            self.get_queryset().filter(id__in=contact_ids).values_list('id', flat=True)
+        )
 
-        for contact in contacts:
-            contact.tags.remove(*tags)
+        with transaction.atomic():
+            Contact.tags.through.objects.filter(
+                contact_id__in=contact_ids,
+                tag_id__in=tag_ids,
+            ).delete()
 
-        return Response({'updated_count': contacts.count()})
+        return Response({'updated_count': len(contact_ids)})
 
     @action(detail=False, methods=['post'])
     def bulk_add_to_list(self, request):
@@ -234,11 +378,23 @@ class ContactViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        contacts = self.get_queryset().filter(id__in=contact_ids)
-        contact_list.contacts.add(*contacts)
-        contact_list.update_contact_count()
+        contact_ids = list(
+            self.get_queryset().filter(id__in=contact_ids).values_list('id', flat=True)
+        )
+
+        ListMember = ContactList.contacts.through
+        with transaction.atomic():
+            ListMember.objects.bulk_create(
+                [
+                    ListMember(contactlist_id=contact_list.id, contact_id=contact_id)
+                    for contact_id in contact_ids
+                ],
+                ignore_conflicts=True,
+                batch_size=BULK_BATCH_SIZE,
+            )
+            contact_list.update_static_contact_count()
 
-        return Response({'added_count': contacts.count()})
+        return Response({'added_count': len(contact_ids)})
 
     @action(detail=False, methods=['post'])
     def bulk_remove_from_list(self, request):
@@ -263,19 +419,23 @@ class ContactViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        contacts = self.get_queryset().filter(id__in=contact_ids)
-        contact_list.contacts.remove(*contacts)
-        contact_list.update_contact_count()
+        contact_ids = list(
+            self.get_queryset().filter(id__in=contact_ids).values_list('id', flat=True)
+        )
 
-        return Response({'removed_count': contacts.count()})
+        with transaction.atomic():
+            ContactList.contacts.through.objects.filter(
+                contactlist_id=contact_list.id,
+                contact_id__in=contact_ids,
+            ).delete()
+            contact_list.update_static_contact_count()
+
+        return Response({'removed_count': len(contact_ids)})
 
     @action(detail=False, methods=['get'])
     def export(self, request):
         """Export contacts to CSV."""
-        import csv
-        from django.http import HttpResponse
-
-        queryset = self.get_queryset()
+        queryset = self.get_queryset().prefetch_related(None)
 
         # Apply filters
         status_filter = request.query_params.get('status')
@@ -284,59 +444,37 @@ class ContactViewSet(viewsets.ModelViewSet):
 
         tag_ids = request.query_params.getlist('tags')
         if tag_ids:
-            queryset = queryset.filter(tags__id__in=tag_ids)
+            queryset = queryset.filter(has_any_tag(tag_ids))
 
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="contacts.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow([
-            'Email', 'First Name', 'Last Name', 'Company', 'Job Title',
-            'Phone', 'Website', 'LinkedIn', 'Twitter',
-            'City', 'State', 'Country', 'Timezone',
-            'Score', 'Status', 'Source', 'Notes',
-            'Emails Sent', 'Emails Opened', 'Emails Clicked', 'Emails Replied',
-            'Created At'
-        ])
-
-        for contact in queryset:
-            writer.writerow([
-                contact.email, contact.first_name, contact.last_name,
-                contact.company, contact.job_title,
-                contact.phone, contact.website, contact.linkedin_url, contact.twitter_handle,
-                contact.city, contact.state, contact.country, contact.timezone,
-                contact.score, contact.status, contact.source, contact.notes,
-                contact.emails_sent, contact.emails_opened, contact.emails_clicked, contact.emails_replied,
-                contact.created_at.isoformat()
-            ])
+        rows = (
+            (*row[:-1], row[-1].isoformat())
+            for row in queryset.values_list(*CONTACT_EXPORT_FIELDS).iterator(chunk_size=2000)
+        )
 
+        response = StreamingHttpResponse(
+            iter_csv_rows(CONTACT_EXPORT_HEADER, rows),
+            content_type='text/csv'
+        )
+        response['Content-Disposition'] = 'attachment; filename="contacts.csv"'
         return response
 
 
-class ContactListViewSet(viewsets.ModelViewSet):
+class ContactListViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
     """ViewSet for managing contact lists."""
 
     permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_workspaces = self.request.user.workspaces.all()
-        return ContactList.objects.filter(workspace__in=user_workspaces)
+    queryset = ContactList.objects.all()
 
     def get_serializer_class(self):
         if self.action == 'create':
             return ContactListCreateSerializer
         return ContactListSerializer
 
-    def perform_create(self, serializer):
-        workspace = self.request.user.workspaces.first()
-        if workspace:
-            serializer.save(workspace=workspace)
-
     @action(detail=True, methods=['get'])
     def contacts(self, request, pk=None):
         """Get contacts in a list."""
         contact_list = self.get_object()
-        contacts = contact_list.get_contacts()
+        contacts = contact_list.get_contacts().defer('search_vector').prefetch_related(tags_prefetch())
 
         page = self.paginate_queryset(contacts)
         if page is not None:
@@ -354,33 +492,22 @@ class ContactListViewSet(viewsets.ModelViewSet):
         return Response({'contact_count': contact_list.contact_count})
 
 
-class CustomFieldViewSet(viewsets.ModelViewSet):
+class CustomFieldViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
     """ViewSet for managing custom fields."""
 
     permission_classes = [IsAuthenticated]
+    queryset = CustomField.objects.all()
     serializer_class = CustomFieldSerializer
 
-    def get_queryset(self):
-        user_workspaces = self.request.user.workspaces.all()
-        return CustomField.objects.filter(workspace__in=user_workspaces)
-
-    def perform_create(self, serializer):
-        workspace = self.request.user.workspaces.first()
-        if workspace:
-            serializer.save(workspace=workspace)
 
-
-class ImportJobViewSet(viewsets.ModelViewSet):
+class ImportJobViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
     """ViewSet for managing import jobs."""
 
     permission_classes = [IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
+    queryset = ImportJob.objects.all()
     serializer_class = ImportJobSerializer
 
-    def get_queryset(self):
-        user_workspaces = self.request.user.workspaces.all()
-        return ImportJob.objects.filter(workspace__in=user_workspaces)
-
     @action(detail=False, methods=['post'])
     def upload(self, request):
         """Upload a file for import."""
@@ -405,23 +532,18 @@ class ImportJobViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Save file
+        # Save file (temporary uploads are moved into place rather than copied)
         import os
         from django.conf import settings
+        from django.core.files.storage import FileSystemStorage
         from django.utils import timezone
 
-        upload_dir = os.path.join(settings.MEDIA_ROOT, 'imports')
-        os.makedirs(upload_dir, exist_ok=True)
-
+        storage = FileSystemStorage(location=os.path.join(settings.MEDIA_ROOT, 'imports'))
         timestamp = timezone.now().strftime('%Y%m%d_%H%M%S')
-        file_path = os.path.join(upload_dir, f"{timestamp}_{file.name}")
-
-        with open(file_path, 'wb+') as dest:
-            for chunk in file.chunks():
-                dest.write(chunk)
+        file_path = storage.path(storage.save(f"{timestamp}_{file.name}", file))
 
         # Create import job
-        workspace = request.user.workspaces.first()
+        workspace = self.get_workspace()
         import_job = ImportJob.objects.create(
             workspace=workspace,
             user=request.user,
@@ -446,32 +568,38 @@ class ImportJobViewSet(viewsets.ModelViewSet):
         try:
             if file_type == ImportJob.FileType.CSV:
                 import csv
+                import io
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    headers = reader.fieldnames
-                    rows = []
-                    for i, row in enumerate(reader):
-                        if i >= 5:
-                            break
-                        rows.append(row)
+                    head = f.read(PREVIEW_READ_CHARS)
+                if len(head) == PREVIEW_READ_CHARS:
+                    # Drop the trailing partial line so no half row is previewed
+                    head = head[:head.rfind('\n') + 1] or head
+                reader = csv.DictReader(io.StringIO(head))
+                headers = reader.fieldnames
+                rows = list(islice(reader, PREVIEW_ROW_LIMIT))
                 return {'headers': headers, 'rows': rows}
 
             elif file_type == ImportJob.FileType.EXCEL:
                 import openpyxl
-                wb = openpyxl.load_workbook(file_path, read_only=True)
-                sheet = wb.active
-                rows = list(sheet.iter_rows(max_row=6, values_only=True))
-                headers = [str(h) if h else '' for h in rows[0]] if rows else []
-                data_rows = [dict(zip(headers, row)) for row in rows[1:6]]
+                wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+                try:
+                    sheet_rows = wb.active.iter_rows(values_only=True)
+                    header_row = next(sheet_rows, None)
+                    headers = [str(h) if h else '' for h in header_row] if header_row else []
+                    data_rows = [
+                        dict(zip(headers, row))
+                        for row in islice(sheet_rows, PREVIEW_ROW_LIMIT)
+                    ]
+                finally:
+                    wb.close()
                 return {'headers': headers, 'rows': data_rows}
 
             elif file_type == ImportJob.FileType.JSON:
-                import json
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                if isinstance(data, list) and len(data) > 0:
-                    headers = list(data[0].keys()) if isinstance(data[0], dict) else []
-                    return {'headers': headers, 'rows': data[:5]}
+                    rows = list(islice(_iter_json_array(f), PREVIEW_ROW_LIMIT))
+                if rows:
+                    headers = list(rows[0].keys()) if isinstance(rows[0], dict) else []
+                    return {'headers': headers, 'rows': rows}
                 return {'headers': [], 'rows': []}
 
         except Exception as e:
@@ -533,14 +661,30 @@ from .serializers import (
 from .services import ScoringEngine
 
 
-class ScoringRuleViewSet(viewsets.ModelViewSet):
+# Scoring stats and hot leads are cheap to serve stale for a couple of minutes
+SCORING_CACHE_TIMEOUT = 120
+
+
+def _scoring_cache_key(workspace_id, name):
+    """Build a scoring cache key under the workspace's current cache generation."""
+    generation = cache.get_or_set(f'scoring:generation:{workspace_id}', 1, timeout=None)
+    return f'scoring:{name}:{workspace_id}:{generation}'
+
+
+def invalidate_scoring_cache(workspace_id):
+    """Drop all cached scoring responses for a workspace by bumping its generation."""
+    try:
+        cache.incr(f'scoring:generation:{workspace_id}')
+    except ValueError:
+        # Nothing has been cached for this workspace yet
+        pass
+
+
+class ScoringRuleViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
     """ViewSet for managing scoring rules."""
 
     permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_workspaces = self.request.user.workspaces.all()
-        return ScoringRule.objects.filter(workspace__in=user_workspaces)
+    queryset = ScoringRule.objects.all()
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -548,112 +692,149 @@ class ScoringRuleViewSet(viewsets.ModelViewSet):
         return ScoringRuleSerializer
 
     def perform_create(self, serializer):
-        workspace = self.request.user.workspaces.first()
-        if workspace:
-            serializer.save(workspace=workspace)
+        super().perform_create(serializer)
+        invalidate_scoring_cache(serializer.instance.workspace_id)
+
+    def perform_update(self, serializer):
+        rule = serializer.save()
+        invalidate_scoring_cache(rule.workspace_id)
+
+    def perform_destroy(self, instance):
+        workspace_id = instance.workspace_id
+        instance.delete()
+        invalidate_scoring_cache(workspace_id)
 
     @action(detail=True, methods=['post'])
     def toggle(self, request, pk=None):
         """Toggle rule active status."""
-        rule = self.get_object()
-        rule.is_active = not rule.is_active
-        rule.save(update_fields=['is_active'])
-        return Response({'is_active': rule.is_active})
+        not_found = Response({'error': 'Scoring rule not found'}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            pk = uuid.UUID(str(pk))
+        except ValueError:
+            return not_found
+
+        rules = self.get_queryset().filter(pk=pk)
+        if not rules.update(is_active=~F('is_active')):
+            return not_found
+        is_active, workspace_id = rules.values_list('is_active', 'workspace_id').get()
+        invalidate_scoring_cache(workspace_id)
+        return Response({'is_active': is_active})
 
 
-class ScoreThresholdViewSet(viewsets.ModelViewSet):
+class ScoreThresholdViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
     """ViewSet for managing score thresholds."""
 
     permission_classes = [IsAuthenticated]
+    queryset = ScoreThreshold.objects.all()
     serializer_class = ScoreThresholdSerializer
 
-    def get_queryset(self):
-        user_workspaces = self.request.user.workspaces.all()
-        return ScoreThreshold.objects.filter(workspace__in=user_workspaces)
-
     def perform_create(self, serializer):
-        workspace = self.request.user.workspaces.first()
-        if workspace:
-            serializer.save(workspace=workspace)
+        super().perform_create(serializer)
+        invalidate_scoring_cache(serializer.instance.workspace_id)
+        ReportsService.invalidate_cache(serializer.instance.workspace_id)
+
+    def perform_update(self, serializer):
+        threshold = serializer.save()
+        invalidate_scoring_cache(threshold.workspace_id)
+        ReportsService.invalidate_cache(threshold.workspace_id)
 
+    def perform_destroy(self, instance):
+        workspace_id = instance.workspace_id
+        instance.delete()
+        invalidate_scoring_cache(workspace_id)
+        ReportsService.invalidate_cache(workspace_id)
 
-class ScoreDecayConfigViewSet(viewsets.ModelViewSet):
+
+class ScoreDecayConfigViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
     """ViewSet for managing score decay config."""
 
     permission_classes = [IsAuthenticated]
+    queryset = ScoreDecayConfig.objects.select_related('workspace')
     serializer_class = ScoreDecayConfigSerializer
 
-    def get_queryset(self):
-        user_workspaces = self.request.user.workspaces.all()
-        return ScoreDecayConfig.objects.filter(workspace__in=user_workspaces)
-
-    def perform_create(self, serializer):
-        workspace = self.request.user.workspaces.first()
-        if workspace:
-            serializer.save(workspace=workspace)
-
     @action(detail=True, methods=['post'])
     def run_decay(self, request, pk=None):
         """Manually run score decay."""
         config = self.get_object()
         engine = ScoringEngine(config.workspace)
         result = engine.run_score_decay()
+        if result.get('success'):
+            invalidate_scoring_cache(config.workspace_id)
         return Response(result)
 
 
-class ScoringViewSet(viewsets.ViewSet):
+class ScoringViewSet(WorkspaceViewSetMixin, viewsets.ViewSet):
     """ViewSet for scoring operations."""
 
     permission_classes = [IsAuthenticated]
 
+    @staticmethod
+    def _get_member_contact(request, contact_id):
+        """
+        Fetch a contact and its workspace in one query, scoped to workspaces
+        the requesting user is a member of. Returns None if not accessible.
+        """
+        try:
+            return Contact.objects.select_related('workspace').defer('search_vector').get(
+                id=contact_id,
+                workspace__members__user=request.user
+            )
+        except Contact.DoesNotExist:
+            return None
+
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Get scoring statistics."""
-        workspace = request.user.workspaces.first()
+        workspace = self.get_workspace()
         if not workspace:
             return Response({'error': 'No workspace found'}, status=status.HTTP_404_NOT_FOUND)
 
-        engine = ScoringEngine(workspace)
-        stats = engine.get_score_stats()
+        cache_key = _scoring_cache_key(workspace.id, 'stats')
+        stats = cache.get(cache_key)
+        if stats is None:
+            engine = ScoringEngine(workspace)
+            stats = engine.get_score_stats()
+            cache.set(cache_key, stats, SCORING_CACHE_TIMEOUT)
         return Response(stats)
 
     @action(detail=False, methods=['get'])
     def hot_leads(self, request):
         """Get hot leads."""
-        workspace = request.user.workspaces.first()
+        workspace = self.get_workspace()
         if not workspace:
             return Response({'error': 'No workspace found'}, status=status.HTTP_404_NOT_FOUND)
 
         limit = int(request.query_params.get('limit', 50))
-        engine = ScoringEngine(workspace)
-        leads = engine.get_hot_leads(limit=limit)
-
-        serializer = ContactSerializer(leads, many=True)
-        return Response(serializer.data)
+        cache_key = _scoring_cache_key(workspace.id, f'hot_leads:{limit}')
+        data = cache.get(cache_key)
+        if data is None:
+            engine = ScoringEngine(workspace)
+            leads = engine.get_hot_leads(limit=limit)
+            data = ContactSerializer(leads, many=True).data
+            cache.set(cache_key, data, SCORING_CACHE_TIMEOUT)
+        return Response(data)
 
     @action(detail=False, methods=['post'], url_path='contact/(?P<contact_id>[^/.]+)/adjust')
     def adjust_score(self, request, contact_id=None):
         """Adjust a contact's score."""
-        workspace = request.user.workspaces.first()
-        if not workspace:
-            return Response({'error': 'No workspace found'}, status=status.HTTP_404_NOT_FOUND)
-
-        try:
-            contact = Contact.objects.get(id=contact_id, workspace=workspace)
-        except Contact.DoesNotExist:
+        contact = self._get_member_contact(request, contact_id)
+        if contact is None:
             return Response({'error': 'Contact not found'}, status=status.HTTP_404_NOT_FOUND)
 
         serializer = ScoreAdjustmentSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
 
-        engine = ScoringEngine(workspace)
+        engine = ScoringEngine(contact.workspace)
 
         if 'score' in data:
             result = engine.set_score(contact, data['score'], data.get('reason', 'Manual adjustment'))
         else:
             result = engine.adjust_score(contact, data['adjustment'], data.get('reason', 'Manual adjustment'))
 
+        if result.score_change:
+            invalidate_scoring_cache(contact.workspace_id)
+
         return Response({
             'success': result.success,
             'previous_score': result.previous_score,
@@ -665,22 +846,20 @@ class ScoringViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['post'], url_path='contact/(?P<contact_id>[^/.]+)/apply-event')
     def apply_event(self, request, contact_id=None):
         """Apply a scoring event to a contact."""
-        workspace = request.user.workspaces.first()
-        if not workspace:
-            return Response({'error': 'No workspace found'}, status=status.HTTP_404_NOT_FOUND)
-
-        try:
-            contact = Contact.objects.get(id=contact_id, workspace=workspace)
-        except Contact.DoesNotExist:
+        contact = self._get_member_contact(request, contact_id)
+        if contact is None:
             return Response({'error': 'Contact not found'}, status=status.HTTP_404_NOT_FOUND)
 
         serializer = ApplyEventSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
 
-        engine = ScoringEngine(workspace)
+        engine = ScoringEngine(contact.workspace)
         result = engine.apply_event(contact, data['event_type'], data.get('event_data', {}))
 
+        if result.score_change:
+            invalidate_scoring_cache(contact.workspace_id)
+
         return Response({
             'success': result.success,
             'previous_score': result.previous_score,
@@ -693,13 +872,8 @@ class ScoringViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'], url_path='contact/(?P<contact_id>[^/.]+)/history')
     def score_history(self, request, contact_id=None):
         """Get score history for a contact."""
-        workspace = request.user.workspaces.first()
-        if not workspace:
-            return Response({'error': 'No workspace found'}, status=status.HTTP_404_NOT_FOUND)
-
-        try:
-            contact = Contact.objects.get(id=contact_id, workspace=workspace)
-        except Contact.DoesNotExist:
+        contact = self._get_member_contact(request, contact_id)
+        if contact is None:
             return Response({'error': 'Contact not found'}, status=status.HTTP_404_NOT_FOUND)
 
         history = ScoreHistory.objects.filter(contact=contact)[:100]
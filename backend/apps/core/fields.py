@@ -0,0 +1,99 @@
+"""Model fields that encrypt their values at rest."""
+
+import base64
+import hashlib
+import os
+from functools import lru_cache
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from django.conf import settings
+from django.core.exceptions import FieldError
+from django.db import models
+
+
+# Prefix marking a stored value as ciphertext; values without it are
+# legacy plaintext and are returned unchanged
+ENCRYPTED_PREFIX = 'enc:'
+
+NONCE_SIZE = 12
+
+
+@lru_cache(maxsize=1)
+def _cipher() -> AESGCM:
+    """AES-256-GCM cipher for FIELD_ENCRYPTION_KEY (or one derived from SECRET_KEY)."""
+    key = getattr(settings, 'FIELD_ENCRYPTION_KEY', '')
+    if key:
+        key = base64.urlsafe_b64decode(key)
+    else:
+        key = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
+    return AESGCM(key)
+
+
+def encrypt_value(value: str, aad: bytes) -> str:
+    """Encrypt `value`, binding it to `aad`."""
+    nonce = os.urandom(NONCE_SIZE)
+    ciphertext = _cipher().encrypt(nonce, value.encode(), aad)
+    return ENCRYPTED_PREFIX + base64.urlsafe_b64encode(nonce + ciphertext).decode()
+
+
+@lru_cache(maxsize=1024)
+def decrypt_value(value: str, aad: bytes) -> str:
+    """Decrypt a value produced by `encrypt_value`.
+
+    Results are memoized; every stored value has its own nonce, so the
+    ciphertext identifies the plaintext.
+    """
+    if not value.startswith(ENCRYPTED_PREFIX):
+        return value
+
+    data = base64.urlsafe_b64decode(value[len(ENCRYPTED_PREFIX):])
+    try:
+        plaintext = _cipher().decrypt(data[:NONCE_SIZE], data[NONCE_SIZE:], aad)
+    except InvalidTag:
+        raise ValueError("Encrypted field could not be decrypted; check FIELD_ENCRYPTION_KEY")
+    return plaintext.decode()
+
+
+class EncryptedFieldMixin:
+    """Encrypts with AES-GCM on save and decrypts on load.
+
+    The ciphertext is bound to the model and field name, so a value cannot
+    be copied into another encrypted column. Empty values are stored as-is.
+    Every encryption uses a fresh nonce, so filtering on the value could
+    never match; only `isnull` lookups are allowed.
+    """
+
+    def _aad(self) -> bytes:
+        return f'{self.model._meta.label_lower}.{self.name}'.encode()
+
+    def get_lookup(self, lookup_name):
+        if lookup_name != 'isnull':
+            raise FieldError(
+                f"Encrypted field '{self.name}' does not support the "
+                f"'{lookup_name}' lookup"
+            )
+        return super().get_lookup(lookup_name)
+
+    def from_db_value(self, value, expression, connection):
+        if not value:
+            return value
+        return decrypt_value(value, self._aad())
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if not value:
+            return value
+        return encrypt_value(value, self._aad())
+
+
+class EncryptedCharField(EncryptedFieldMixin, models.CharField):
+    """CharField stored encrypted. max_length bounds the stored ciphertext.
+
+    Ciphertext is roughly 1.4x the plaintext plus ~40 characters, so prefer
+    EncryptedTextField unless input is capped well below max_length.
+    """
+
+
+class EncryptedTextField(EncryptedFieldMixin, models.TextField):
+    """TextField stored encrypted."""
@@ -1,5 +1,7 @@
 """Reusable mixins for views and viewsets."""
 
+from apps.workspaces.models import Workspace
+
 
 class WorkspaceViewSetMixin:
     """
@@ -9,40 +11,37 @@ class WorkspaceViewSetMixin:
     The model should have a `workspace` ForeignKey field.
     """
 
+    def get_workspace(self):
+        """Resolve the workspace for this request, memoized on the request."""
+        if not hasattr(self.request, '_workspace'):
+            # Get workspace from user's current workspace or request headers
+            workspace = getattr(self.request.user, 'current_workspace', None)
+
+            if workspace is None:
+                workspace_id = self.request.headers.get('X-Workspace-ID')
+                if workspace_id:
+                    workspace = Workspace.objects.filter(
+                        id=workspace_id,
+                        members__user=self.request.user
+                    ).first()
+
+            self.request._workspace = workspace
+
+        return self.request._workspace
+
     def get_queryset(self):
         """Filter queryset by current workspace."""
         queryset = super().get_queryset()
-
-        # Get workspace from request headers or user's current workspace
-        workspace = getattr(self.request.user, 'current_workspace', None)
-
-        if workspace is None:
-            # Try to get from header
-            workspace_id = self.request.headers.get('X-Workspace-ID')
-            if workspace_id:
-                from apps.workspaces.models import Workspace
-                try:
-                    workspace = Workspace.objects.get(id=workspace_id)
-                except Workspace.DoesNotExist:
-                    pass
+        workspace = self.get_workspace()
 
         if workspace:
-            return queryset.filter(workspace=workspace)
+            return queryset.filter(workspace_id=workspace.id)
 
         return queryset.none()
 
     def perform_create(self, serializer):
         """Automatically set workspace on create."""
-        workspace = getattr(self.request.user, 'current_workspace', None)
-
-        if workspace is None:
-            workspace_id = self.request.headers.get('X-Workspace-ID')
-            if workspace_id:
-                from apps.workspaces.models import Workspace
-                try:
-                    workspace = Workspace.objects.get(id=workspace_id)
-                except Workspace.DoesNotExist:
-                    pass
+        workspace = self.get_workspace()
 
         if workspace:
             serializer.save(workspace=workspace)
@@ -0,0 +1,28 @@
+"""Pagination classes shared across apps."""
+
+from rest_framework.pagination import PageNumberPagination
+
+
+class ShortResultPageNumberPagination(PageNumberPagination):
+    """
+    Page-number pagination that skips the COUNT(*) query for short results.
+
+    When the first page is requested, up to ``page_size + 1`` rows are
+    fetched. If they all fit on one page, the total is known without a
+    separate COUNT and the page is built from the fetched rows. Larger
+    result sets fall back to regular page-number pagination. The response
+    shape is unchanged.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size or str(request.query_params.get(self.page_query_param, 1)) != '1':
+            return super().paginate_queryset(queryset, request, view)
+
+        rows = list(queryset[:page_size + 1])
+        if len(rows) > page_size:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page = self.django_paginator_class(rows, page_size).page(1)
+        return rows
@@ -0,0 +1,30 @@
+from rest_framework import serializers
+
+
+class ReportQuerySerializer(serializers.Serializer):
+    """Query parameters accepted by the report endpoints.
+
+    Instances hold no per-request state, so views validate with a shared
+    module-level instance: `REPORT_QUERY.run_validation(request.query_params)`.
+    """
+
+    days = serializers.IntegerField(min_value=1, max_value=365, default=30)
+    granularity = serializers.ChoiceField(
+        choices=['hour', 'day', 'week', 'month'],
+        default='day'
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=50)
+    min_score = serializers.IntegerField(min_value=0, required=False)
+
+
+class PerformanceQuerySerializer(ReportQuerySerializer):
+    """Report query parameters with a one-week default period."""
+
+    days = serializers.IntegerField(min_value=1, max_value=365, default=7)
+
+
+class ActivityTimelineQuerySerializer(ReportQuerySerializer):
+    """Activity timeline query parameters, paginated by event cursor."""
+
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=50)
+    after = serializers.UUIDField(required=False)
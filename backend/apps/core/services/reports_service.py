@@ -1,11 +1,73 @@
-import csv
-import io
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from django.db.models import Count, Sum, Avg, F, Q, Case, When, Value, IntegerField
-from django.db.models.functions import TruncDate, TruncHour, TruncDay, TruncWeek, TruncMonth
+from typing import Optional, List, Dict, Any, Iterable, Iterator
+from django.db import models
+from django.db.models import (
+    Count, Sum, Avg, F, Q, Case, When, Value, IntegerField, FloatField, OuterRef,
+    Subquery,
+)
+from django.db.models.functions import Coalesce, NullIf, Round, TruncDate, TruncHour, TruncDay, TruncWeek, TruncMonth
+from django.core.cache import cache
 from django.utils import timezone
 
+from apps.core.streaming import iter_csv_rows
+
+
+# Cache lifetimes (seconds) for the aggregate reports
+DASHBOARD_CACHE_TIMEOUT = 60
+EMAIL_STATS_CACHE_TIMEOUT = 60
+HOT_LEADS_CACHE_TIMEOUT = 60
+SCORE_DISTRIBUTION_CACHE_TIMEOUT = 300
+PERFORMANCE_SUMMARY_CACHE_TIMEOUT = 120
+CAMPAIGN_REPORT_CACHE_TIMEOUT = 30
+# Finished campaigns still receive opens and clicks
+FINISHED_CAMPAIGN_REPORT_CACHE_TIMEOUT = 5 * 60
+HOT_THRESHOLD_CACHE_TIMEOUT = 60 * 60
+
+# Hot lead min_score used when a workspace has no hot threshold configured
+DEFAULT_HOT_THRESHOLD = 70
+
+# Hours before the start of the previous hour are read from the hourly
+# tracking rollup, which is refreshed every 15 minutes
+TRACKING_ROLLUP_LAG = timedelta(hours=1)
+
+# Date truncation (date_trunc on PostgreSQL) per report granularity
+TRUNC_FUNCTIONS = {
+    'hour': TruncHour,
+    'day': TruncDay,
+    'week': TruncWeek,
+    'month': TruncMonth,
+}
+
+# Rows fetched per round-trip when streaming CSV exports
+EXPORT_CHUNK_SIZE = 2000
+
+
+# Contact columns read by the hot leads report and export
+HOT_LEAD_FIELDS = (
+    'id', 'email', 'first_name', 'last_name', 'company', 'score',
+    'emails_opened', 'emails_clicked', 'emails_replied',
+    'last_opened_at', 'last_clicked_at', 'last_replied_at', 'created_at',
+)
+
+
+def _percentage(numerator, denominator):
+    """SQL expression for numerator/denominator as a percentage rounded to one
+    decimal place, or 0 when the denominator is 0 or NULL."""
+    return Coalesce(
+        Round(numerator * 100.0 / NullIf(denominator, 0), 1),
+        Value(0.0),
+        output_field=FloatField(),
+    )
+
+
+def _last_activity(contact) -> Optional[datetime]:
+    """Latest open, click or reply timestamp of a contact."""
+    timestamps = [
+        t for t in (contact.last_opened_at, contact.last_clicked_at, contact.last_replied_at)
+        if t is not None
+    ]
+    return max(timestamps, default=None)
+
 
 class ReportsService:
     """Service for generating reports and analytics."""
@@ -13,6 +75,48 @@ class ReportsService:
     def __init__(self, workspace_id: str):
         self.workspace_id = workspace_id
 
+    # ==================== Caching ====================
+
+    @staticmethod
+    def _generation_key(workspace_id) -> str:
+        return f'reports:generation:{workspace_id}'
+
+    def _cache_key(self, name: str) -> str:
+        """Build a report cache key under the workspace's current cache generation."""
+        generation = cache.get_or_set(
+            self._generation_key(self.workspace_id), 1, timeout=None
+        )
+        return f'reports:{name}:{self.workspace_id}:{generation}'
+
+    @classmethod
+    def invalidate_cache(cls, workspace_id) -> None:
+        """Drop all cached reports for a workspace by bumping its generation.
+
+        Args:
+            workspace_id: Workspace ID
+        """
+        try:
+            cache.incr(cls._generation_key(workspace_id))
+        except ValueError:
+            # Nothing has been cached for this workspace yet
+            pass
+
+    def _hot_threshold(self) -> int:
+        """Get the workspace's hot lead min_score, defaulting to 70."""
+        from apps.contacts.models import ScoreThreshold
+
+        cache_key = self._cache_key('hot_threshold')
+        min_score = cache.get(cache_key)
+        if min_score is None:
+            min_score = ScoreThreshold.objects.filter(
+                workspace_id=self.workspace_id,
+                classification=ScoreThreshold.Classification.HOT
+            ).values_list('min_score', flat=True).first()
+            if min_score is None:
+                min_score = DEFAULT_HOT_THRESHOLD
+            cache.set(cache_key, min_score, HOT_THRESHOLD_CACHE_TIMEOUT)
+        return min_score
+
     # ==================== Dashboard Statistics ====================
 
     def get_dashboard_stats(self, days: int = 30) -> dict:
@@ -28,52 +132,55 @@ class ReportsService:
         from apps.campaigns.models import Campaign, CampaignRecipient
         from apps.tracking.models import TrackingEvent, SuppressionList
 
-        start_date = timezone.now() - timedelta(days=days)
-
-        # Contact stats
-        total_contacts = Contact.objects.filter(
-            workspace_id=self.workspace_id
-        ).count()
+        cache_key = self._cache_key(f'dashboard:{days}')
+        stats = cache.get(cache_key)
+        if stats is not None:
+            return stats
 
-        new_contacts = Contact.objects.filter(
-            workspace_id=self.workspace_id,
-            created_at__gte=start_date
-        ).count()
+        start_date = timezone.now() - timedelta(days=days)
 
-        active_contacts = Contact.objects.filter(
-            workspace_id=self.workspace_id,
-            is_unsubscribed=False,
-            is_bounced=False
-        ).count()
+        # Hot leads are contacts scoring at or above the hot threshold
+        hot_min_score = self._hot_threshold()
 
-        # Campaign stats
-        total_campaigns = Campaign.objects.filter(
+        # Contact stats
+        contact_counts = Contact.objects.filter(
             workspace_id=self.workspace_id
-        ).count()
-
-        active_campaigns = Campaign.objects.filter(
-            workspace_id=self.workspace_id,
-            status__in=['sending', 'scheduled']
-        ).count()
-
-        completed_campaigns = Campaign.objects.filter(
-            workspace_id=self.workspace_id,
-            status='completed',
-            completed_at__gte=start_date
-        ).count()
+        ).aggregate(
+            total=Count('id'),
+            new=Count('id', filter=Q(created_at__gte=start_date)),
+            active=Count('id', filter=Q(status=Contact.Status.ACTIVE)),
+            hot_leads=Count('id', filter=Q(score__gte=hot_min_score) & ~Q(
+                status=Contact.Status.UNSUBSCRIBED
+            )),
+        )
 
-        # Email stats (from campaigns in the time range)
+        # Campaign stats, plus email stats from campaigns in the time range
+        in_range = Q(started_at__gte=start_date)
         campaign_stats = Campaign.objects.filter(
-            workspace_id=self.workspace_id,
-            started_at__gte=start_date
+            workspace_id=self.workspace_id
         ).aggregate(
-            total_sent=Sum('sent_count'),
-            total_delivered=Sum('delivered_count'),
-            total_opened=Sum('unique_opens'),
-            total_clicked=Sum('unique_clicks'),
-            total_replied=Sum('replied_count'),
-            total_bounced=Sum('bounced_count'),
-            total_unsubscribed=Sum('unsubscribed_count'),
+            total=Count('id'),
+            active=Count('id', filter=Q(status__in=['sending', 'scheduled'])),
+            completed=Count('id', filter=Q(
+                status='completed',
+                completed_at__gte=start_date
+            )),
+            total_sent=Sum('sent_count', filter=in_range),
+            total_delivered=Sum('delivered_count', filter=in_range),
+            total_opened=Sum('unique_opens', filter=in_range),
+            total_clicked=Sum('unique_clicks', filter=in_range),
+            total_replied=Sum('replied_count', filter=in_range),
+            total_bounced=Sum('bounced_count', filter=in_range),
+            total_unsubscribed=Sum('unsubscribed_count', filter=in_range),
+            open_rate=_percentage(
+                Sum('unique_opens', filter=in_range), Sum('sent_count', filter=in_range)
+            ),
+            click_rate=_percentage(
+                Sum('unique_clicks', filter=in_range), Sum('unique_opens', filter=in_range)
+            ),
+            reply_rate=_percentage(
+                Sum('replied_count', filter=in_range), Sum('sent_count', filter=in_range)
+            ),
         )
 
         total_sent = campaign_stats['total_sent'] or 0
@@ -81,46 +188,17 @@ class ReportsService:
         total_clicked = campaign_stats['total_clicked'] or 0
         total_replied = campaign_stats['total_replied'] or 0
 
-        # Calculate rates
-        open_rate = (total_opened / total_sent * 100) if total_sent > 0 else 0
-        click_rate = (total_clicked / total_opened * 100) if total_opened > 0 else 0
-        reply_rate = (total_replied / total_sent * 100) if total_sent > 0 else 0
-
         # Suppression stats
         suppressed_count = SuppressionList.objects.filter(
             workspace_id=self.workspace_id
         ).count()
 
-        # Hot leads (score >= hot threshold)
-        from apps.contacts.models import ScoreThreshold
-        try:
-            hot_threshold = ScoreThreshold.objects.get(
-                workspace_id=self.workspace_id,
-                name='hot'
-            )
-            hot_leads_count = Contact.objects.filter(
-                workspace_id=self.workspace_id,
-                score__gte=hot_threshold.min_score,
-                is_unsubscribed=False
-            ).count()
-        except ScoreThreshold.DoesNotExist:
-            hot_leads_count = Contact.objects.filter(
-                workspace_id=self.workspace_id,
-                score__gte=70,
-                is_unsubscribed=False
-            ).count()
-
-        return {
-            'contacts': {
-                'total': total_contacts,
-                'new': new_contacts,
-                'active': active_contacts,
-                'hot_leads': hot_leads_count,
-            },
+        stats = {
+            'contacts': contact_counts,
             'campaigns': {
-                'total': total_campaigns,
-                'active': active_campaigns,
-                'completed': completed_campaigns,
+                'total': campaign_stats['total'],
+                'active': campaign_stats['active'],
+                'completed': campaign_stats['completed'],
             },
             'emails': {
                 'sent': total_sent,
@@ -132,13 +210,15 @@ class ReportsService:
                 'unsubscribed': campaign_stats['total_unsubscribed'] or 0,
             },
             'rates': {
-                'open_rate': round(open_rate, 1),
-                'click_rate': round(click_rate, 1),
-                'reply_rate': round(reply_rate, 1),
+                'open_rate': campaign_stats['open_rate'],
+                'click_rate': campaign_stats['click_rate'],
+                'reply_rate': campaign_stats['reply_rate'],
             },
             'suppressed': suppressed_count,
             'period_days': days,
         }
+        cache.set(cache_key, stats, DASHBOARD_CACHE_TIMEOUT)
+        return stats
 
     def get_email_stats_over_time(
         self,
@@ -154,22 +234,51 @@ class ReportsService:
         Returns:
             List of stats per time period
         """
-        from apps.tracking.models import TrackingEvent
+        # Choose truncation function
+        if granularity not in TRUNC_FUNCTIONS:
+            granularity = 'day'
+        trunc_func = TRUNC_FUNCTIONS[granularity]
+
+        cache_key = self._cache_key(f'email_stats:{days}:{granularity}')
+        stats = cache.get(cache_key)
+        if stats is not None:
+            return stats
 
         start_date = timezone.now() - timedelta(days=days)
 
-        # Choose truncation function
-        trunc_func = {
-            'hour': TruncHour,
-            'day': TruncDay,
-            'week': TruncWeek,
-            'month': TruncMonth,
-        }.get(granularity, TruncDay)
-
-        # Get events grouped by time
+        if days > 1:
+            # Whole hours are read from the hourly rollup
+            start_date = timezone.localtime(start_date).replace(
+                minute=0, second=0, microsecond=0
+            )
+            periods = self._tracking_event_counts(trunc_func, start_date)
+        else:
+            periods = self._live_tracking_event_counts(
+                trunc_func,
+                Q(campaign_recipient__campaign__workspace_id=self.workspace_id,
+                  created_at__gte=start_date),
+            )
+
+        stats = [
+            {
+                'date': period.isoformat() if period else None,
+                'opens': counts['opens'],
+                'clicks': counts['clicks'],
+                'unsubscribes': counts['unsubscribes'],
+                'bounces': counts['bounces'],
+            }
+            for period, counts in periods
+        ]
+        cache.set(cache_key, stats, EMAIL_STATS_CACHE_TIMEOUT)
+        return stats
+
+    @staticmethod
+    def _live_tracking_event_counts(trunc_func, event_filter: Q) -> List[tuple]:
+        """Count human tracking events per period straight from TrackingEvent."""
+        from apps.tracking.models import TrackingEvent
+
         events = TrackingEvent.objects.filter(
-            campaign_recipient__campaign__workspace_id=self.workspace_id,
-            created_at__gte=start_date,
+            event_filter,
             is_bot=False
         ).annotate(
             period=trunc_func('created_at')
@@ -180,16 +289,64 @@ class ReportsService:
             bounces=Count('id', filter=Q(event_type='bounce')),
         ).order_by('period')
 
-        return [
-            {
-                'date': e['period'].isoformat() if e['period'] else None,
-                'opens': e['opens'],
-                'clicks': e['clicks'],
-                'unsubscribes': e['unsubscribes'],
-                'bounces': e['bounces'],
-            }
-            for e in events
-        ]
+        return [(e.pop('period'), e) for e in events]
+
+    def _tracking_event_counts(
+        self,
+        trunc_func,
+        start_date: Optional[datetime] = None,
+        campaign_id: Optional[str] = None,
+    ) -> List[tuple]:
+        """Count human tracking events per period.
+
+        Hours older than the rollup cutoff come from TrackingEventHourly;
+        only the most recent hours are counted from TrackingEvent.
+
+        Args:
+            trunc_func: Trunc* function for the period granularity
+            start_date: Hour-aligned start of the range, or None for all time
+            campaign_id: Optional campaign to restrict the counts to
+
+        Returns:
+            List of (period, counts) tuples ordered by period
+        """
+        from apps.tracking.models import TrackingEventHourly
+
+        cutoff = timezone.localtime().replace(
+            minute=0, second=0, microsecond=0
+        ) - TRACKING_ROLLUP_LAG
+
+        rollup_filter = Q(workspace_id=self.workspace_id, hour__lt=cutoff)
+        live_filter = Q(
+            campaign_recipient__campaign__workspace_id=self.workspace_id,
+            created_at__gte=cutoff,
+        )
+        if start_date is not None:
+            rollup_filter &= Q(hour__gte=start_date)
+            live_filter &= Q(created_at__gte=start_date)
+        if campaign_id is not None:
+            rollup_filter &= Q(campaign_id=campaign_id)
+            live_filter &= Q(campaign_recipient__campaign_id=campaign_id)
+
+        rollups = TrackingEventHourly.objects.filter(
+            rollup_filter
+        ).annotate(
+            period=trunc_func('hour')
+        ).values('period').annotate(
+            opens=Sum('opens'),
+            clicks=Sum('clicks'),
+            unsubscribes=Sum('unsubscribes'),
+            bounces=Sum('bounces'),
+        ).order_by('period')
+
+        # The live hours may share a period (e.g. a day) with rollup hours
+        periods = {r.pop('period'): r for r in rollups}
+        for period, counts in self._live_tracking_event_counts(trunc_func, live_filter):
+            totals = periods.setdefault(period, dict.fromkeys(counts, 0))
+            for name, value in counts.items():
+                totals[name] += value
+
+        return sorted(periods.items(), key=lambda item: item[0])
 
     # ==================== Campaign Reports ====================
 
@@ -203,10 +360,21 @@ class ReportsService:
             Dict with campaign report data
         """
         from apps.campaigns.models import Campaign, CampaignRecipient
-        from apps.tracking.models import TrackingEvent
 
         campaign = Campaign.objects.get(id=campaign_id, workspace_id=self.workspace_id)
 
+        # Keyed on updated_at and the send counters, so full saves (stats
+        # refreshes) and the sender's update_fields saves both miss the old
+        # entry. Opens and clicks don't touch the campaign; they show up
+        # once the entry expires.
+        cache_key = self._cache_key(
+            f'campaign:{campaign.id}:{campaign.updated_at.timestamp()}'
+            f':{campaign.sent_count}:{campaign.failed_count}'
+        )
+        stats = cache.get(cache_key)
+        if stats is not None:
+            return stats
+
         # Basic stats
         stats = {
             'campaign': {
@@ -214,6 +382,7 @@ class ReportsService:
                 'name': campaign.name,
                 'status': campaign.status,
                 'created_at': campaign.created_at.isoformat(),
+                'updated_at': campaign.updated_at.isoformat(),
                 'started_at': campaign.started_at.isoformat() if campaign.started_at else None,
                 'completed_at': campaign.completed_at.isoformat() if campaign.completed_at else None,
             },
@@ -270,38 +439,34 @@ class ReportsService:
             }
 
         # Timeline of events
-        events_timeline = TrackingEvent.objects.filter(
-            campaign_recipient__campaign=campaign,
-            is_bot=False
-        ).annotate(
-            hour=TruncHour('created_at')
-        ).values('hour').annotate(
-            opens=Count('id', filter=Q(event_type='open')),
-            clicks=Count('id', filter=Q(event_type='click')),
-        ).order_by('hour')
+        events_timeline = self._tracking_event_counts(
+            TruncHour, campaign_id=campaign.id
+        )
 
         stats['timeline'] = [
             {
-                'time': e['hour'].isoformat() if e['hour'] else None,
-                'opens': e['opens'],
-                'clicks': e['clicks'],
+                'time': hour.isoformat() if hour else None,
+                'opens': counts['opens'],
+                'clicks': counts['clicks'],
             }
-            for e in events_timeline
+            for hour, counts in events_timeline
         ]
 
         # Top clicked links
-        from apps.tracking.models import TrackingLink
-        top_links = TrackingLink.objects.filter(
-            campaign_recipient__campaign=campaign
-        ).values('original_url').annotate(
-            total_clicks=Sum('click_count')
-        ).order_by('-total_clicks')[:10]
+        top_links = campaign.link_clicks.order_by('-total_clicks').values(
+            'original_url', 'total_clicks'
+        )[:10]
 
         stats['top_links'] = [
             {'url': l['original_url'], 'clicks': l['total_clicks']}
             for l in top_links
         ]
 
+        if campaign.status in (Campaign.Status.COMPLETED, Campaign.Status.CANCELLED):
+            timeout = FINISHED_CAMPAIGN_REPORT_CACHE_TIMEOUT
+        else:
+            timeout = CAMPAIGN_REPORT_CACHE_TIMEOUT
+        cache.set(cache_key, stats, timeout)
         return stats
 
     def get_campaigns_comparison(
@@ -321,23 +486,31 @@ class ReportsService:
         campaigns = Campaign.objects.filter(
             id__in=campaign_ids,
             workspace_id=self.workspace_id
+        ).annotate(
+            open_rate_calc=_percentage(F('unique_opens'), F('sent_count')),
+            click_rate_calc=_percentage(F('unique_clicks'), F('sent_count')),
+            reply_rate_calc=_percentage(F('replied_count'), F('sent_count')),
+        ).values(
+            'id', 'name', 'status', 'sent_count', 'delivered_count',
+            'unique_opens', 'unique_clicks', 'replied_count', 'bounced_count',
+            'open_rate_calc', 'click_rate_calc', 'reply_rate_calc', 'started_at',
         )
 
         return [
             {
-                'id': str(c.id),
-                'name': c.name,
-                'status': c.status,
-                'sent': c.sent_count,
-                'delivered': c.delivered_count,
-                'opened': c.unique_opens,
-                'clicked': c.unique_clicks,
-                'replied': c.replied_count,
-                'bounced': c.bounced_count,
-                'open_rate': c.open_rate,
-                'click_rate': c.click_rate,
-                'reply_rate': c.reply_rate,
-                'started_at': c.started_at.isoformat() if c.started_at else None,
+                'id': str(c['id']),
+                'name': c['name'],
+                'status': c['status'],
+                'sent': c['sent_count'],
+                'delivered': c['delivered_count'],
+                'opened': c['unique_opens'],
+                'clicked': c['unique_clicks'],
+                'replied': c['replied_count'],
+                'bounced': c['bounced_count'],
+                'open_rate': c['open_rate_calc'],
+                'click_rate': c['click_rate_calc'],
+                'reply_rate': c['reply_rate_calc'],
+                'started_at': c['started_at'].isoformat() if c['started_at'] else None,
             }
             for c in campaigns
         ]
@@ -347,25 +520,25 @@ class ReportsService:
     def get_activity_timeline(
         self,
         limit: int = 50,
-        event_types: Optional[List[str]] = None,
+        event_types: Optional[Iterable[str]] = None,
         contact_id: Optional[str] = None,
         campaign_id: Optional[str] = None,
+        after: Optional[str] = None,
     ) -> List[dict]:
-        """Get activity timeline.
+        """Get activity timeline, newest first.
 
         Args:
             limit: Maximum number of events
             event_types: Filter by event types
             contact_id: Filter by contact
             campaign_id: Filter by campaign
+            after: ID of the last event of the previous page; the page
+                continues with the events just older than it
 
         Returns:
             List of activity events
         """
         from apps.tracking.models import TrackingEvent
-        from apps.contacts.models import ContactActivity
-
-        activities = []
 
         # Get tracking events
         tracking_filter = Q(campaign_recipient__campaign__workspace_id=self.workspace_id)
@@ -375,35 +548,49 @@ class ReportsService:
             tracking_filter &= Q(campaign_recipient__contact_id=contact_id)
         if campaign_id:
             tracking_filter &= Q(campaign_recipient__campaign_id=campaign_id)
+        if after:
+            # Keyset pagination on (created_at, id) rather than OFFSET
+            cursor = TrackingEvent.objects.filter(pk=after).values_list(
+                'created_at', flat=True
+            ).first()
+            if cursor is None:
+                return []
+            tracking_filter &= (
+                Q(created_at__lt=cursor) | Q(created_at=cursor, id__lt=after)
+            )
 
         tracking_events = TrackingEvent.objects.filter(
             tracking_filter,
             is_bot=False
-        ).select_related(
-            'campaign_recipient__contact',
-            'campaign_recipient__campaign'
-        ).order_by('-created_at')[:limit]
-
-        for event in tracking_events:
-            activities.append({
-                'id': str(event.id),
-                'type': event.event_type,
-                'contact_id': str(event.campaign_recipient.contact_id),
-                'contact_email': event.campaign_recipient.contact.email,
-                'contact_name': f"{event.campaign_recipient.contact.first_name} {event.campaign_recipient.contact.last_name}".strip(),
-                'campaign_id': str(event.campaign_recipient.campaign_id),
-                'campaign_name': event.campaign_recipient.campaign.name,
+        ).order_by('-created_at', '-id').values(
+            'id', 'event_type', 'clicked_url', 'device_type', 'city', 'country', 'created_at',
+            'campaign_recipient__contact_id',
+            'campaign_recipient__contact__email',
+            'campaign_recipient__contact__first_name',
+            'campaign_recipient__contact__last_name',
+            'campaign_recipient__campaign_id',
+            'campaign_recipient__campaign__name',
+        )[:limit]
+
+        # Already newest first, straight from the database
+        return [
+            {
+                'id': str(event['id']),
+                'type': event['event_type'],
+                'contact_id': str(event['campaign_recipient__contact_id']),
+                'contact_email': event['campaign_recipient__contact__email'],
+                'contact_name': f"{event['campaign_recipient__contact__first_name']} {event['campaign_recipient__contact__last_name']}".strip(),
+                'campaign_id': str(event['campaign_recipient__campaign_id']),
+                'campaign_name': event['campaign_recipient__campaign__name'],
                 'details': {
-                    'clicked_url': event.clicked_url if event.event_type == 'click' else None,
-                    'device': event.device_type,
-                    'location': f"{event.city}, {event.country}" if event.city and event.country else event.country or None,
+                    'clicked_url': event['clicked_url'] if event['event_type'] == 'click' else None,
+                    'device': event['device_type'],
+                    'location': f"{event['city']}, {event['country']}" if event['city'] and event['country'] else event['country'] or None,
                 },
-                'created_at': event.created_at.isoformat(),
-            })
-
-        # Sort by date
-        activities.sort(key=lambda x: x['created_at'], reverse=True)
-        return activities[:limit]
+                'created_at': event['created_at'].isoformat(),
+            }
+            for event in tracking_events
+        ]
 
     # ==================== Hot Leads Report ====================
 
@@ -421,75 +608,85 @@ class ReportsService:
         Returns:
             Dict with hot leads and stats
         """
-        from apps.contacts.models import Contact, ScoreThreshold, ScoreHistory
+        from apps.contacts.models import Contact, ScoreHistory
 
         # Get threshold if not specified
         if min_score is None:
-            try:
-                hot_threshold = ScoreThreshold.objects.get(
-                    workspace_id=self.workspace_id,
-                    name='hot'
-                )
-                min_score = hot_threshold.min_score
-            except ScoreThreshold.DoesNotExist:
-                min_score = 70
-
-        # Get hot leads
-        hot_leads = Contact.objects.filter(
-            workspace_id=self.workspace_id,
-            score__gte=min_score,
-            is_unsubscribed=False,
-            is_bounced=False
-        ).order_by('-score', '-updated_at')[:limit]
+            min_score = self._hot_threshold()
 
-        leads_data = []
-        for contact in hot_leads:
-            # Get recent score changes
-            recent_history = ScoreHistory.objects.filter(
-                contact=contact
-            ).order_by('-created_at')[:5]
-
-            score_trend = 'stable'
-            if recent_history.count() >= 2:
-                scores = [h.new_score for h in recent_history]
-                if scores[0] > scores[-1]:
-                    score_trend = 'up'
-                elif scores[0] < scores[-1]:
-                    score_trend = 'down'
-
-            leads_data.append({
-                'id': str(contact.id),
-                'email': contact.email,
-                'first_name': contact.first_name,
-                'last_name': contact.last_name,
-                'company': contact.company,
-                'score': contact.score,
-                'score_trend': score_trend,
-                'last_activity_at': contact.last_activity_at.isoformat() if contact.last_activity_at else None,
-                'total_opens': contact.total_opens,
-                'total_clicks': contact.total_clicks,
-                'total_replies': contact.total_replies,
-                'created_at': contact.created_at.isoformat(),
-            })
+        cache_key = self._cache_key(f'hot_leads:{limit}:{min_score}')
+        report = cache.get(cache_key)
+        if report is not None:
+            return report
 
         # Score distribution
-        all_contacts = Contact.objects.filter(
-            workspace_id=self.workspace_id,
-            is_unsubscribed=False
+        distribution = Contact.objects.filter(
+            workspace_id=self.workspace_id
+        ).exclude(
+            status=Contact.Status.UNSUBSCRIBED
+        ).aggregate(
+            hot=Count('id', filter=Q(score__gte=min_score)),
+            warm=Count('id', filter=Q(score__gte=40, score__lt=min_score)),
+            cold=Count('id', filter=Q(score__lt=40)),
         )
 
-        distribution = {
-            'hot': all_contacts.filter(score__gte=min_score).count(),
-            'warm': all_contacts.filter(score__gte=40, score__lt=min_score).count(),
-            'cold': all_contacts.filter(score__lt=40).count(),
-        }
+        # Every hot lead is counted in the distribution, so skip the lead
+        # query when there are none
+        leads_data = []
+        if distribution['hot']:
+            # Get hot leads, annotated with the newest score and the oldest of
+            # their five most recent score changes (or the very first change
+            # when there are fewer than five)
+            history = ScoreHistory.objects.filter(contact=OuterRef('pk'))
+            hot_leads = Contact.objects.filter(
+                workspace_id=self.workspace_id,
+                score__gte=min_score,
+            ).exclude(
+                status__in=[Contact.Status.UNSUBSCRIBED, Contact.Status.BOUNCED]
+            ).only(
+                *HOT_LEAD_FIELDS
+            ).annotate(
+                latest_score=Subquery(
+                    history.order_by('-created_at').values('new_score')[:1]
+                ),
+                oldest_recent_score=Coalesce(
+                    Subquery(history.order_by('-created_at').values('new_score')[4:5]),
+                    Subquery(history.order_by('created_at').values('new_score')[:1]),
+                ),
+            ).order_by('-score', '-updated_at')[:limit]
+
+            for contact in hot_leads:
+                score_trend = 'stable'
+                if contact.latest_score is not None:
+                    if contact.latest_score > contact.oldest_recent_score:
+                        score_trend = 'up'
+                    elif contact.latest_score < contact.oldest_recent_score:
+                        score_trend = 'down'
+
+                last_activity = _last_activity(contact)
+                leads_data.append({
+                    'id': str(contact.id),
+                    'email': contact.email,
+                    'first_name': contact.first_name,
+                    'last_name': contact.last_name,
+                    'company': contact.company,
+                    'score': contact.score,
+                    'score_trend': score_trend,
+                    'last_activity_at': last_activity.isoformat() if last_activity else None,
+                    'total_opens': contact.emails_opened,
+                    'total_clicks': contact.emails_clicked,
+                    'total_replies': contact.emails_replied,
+                    'created_at': contact.created_at.isoformat(),
+                })
 
-        return {
+        report = {
             'leads': leads_data,
             'total_hot_leads': len(leads_data),
             'threshold': min_score,
             'distribution': distribution,
         }
+        cache.set(cache_key, report, HOT_LEADS_CACHE_TIMEOUT)
+        return report
 
     def get_score_distribution(self) -> dict:
         """Get contact score distribution.
@@ -499,9 +696,15 @@ class ReportsService:
         """
         from apps.contacts.models import Contact
 
+        cache_key = self._cache_key('score_distribution')
+        result = cache.get(cache_key)
+        if result is not None:
+            return result
+
         contacts = Contact.objects.filter(
-            workspace_id=self.workspace_id,
-            is_unsubscribed=False
+            workspace_id=self.workspace_id
+        ).exclude(
+            status=Contact.Status.UNSUBSCRIBED
         )
 
         # Score ranges
@@ -510,83 +713,86 @@ class ReportsService:
             (50, 60), (60, 70), (70, 80), (80, 90), (90, 100), (100, 1000)
         ]
 
-        distribution = []
-        for low, high in ranges:
-            count = contacts.filter(score__gte=low, score__lt=high).count()
-            label = f"{low}-{high-1}" if high <= 100 else "100+"
-            distribution.append({
-                'range': label,
-                'count': count,
-            })
-
-        # Stats
-        from django.db.models import Avg, Max, Min
+        # Bucket counts and summary stats in a single pass
+        from django.db.models import Max, Min
         stats = contacts.aggregate(
             avg_score=Avg('score'),
             max_score=Max('score'),
             min_score=Min('score'),
+            total=Count('id'),
+            **{
+                f'bucket_{i}': Count('id', filter=Q(score__gte=low, score__lt=high))
+                for i, (low, high) in enumerate(ranges)
+            }
         )
 
-        return {
+        distribution = [
+            {
+                'range': f"{low}-{high-1}" if high <= 100 else "100+",
+                'count': stats[f'bucket_{i}'],
+            }
+            for i, (low, high) in enumerate(ranges)
+        ]
+
+        result = {
             'distribution': distribution,
             'stats': {
                 'average': round(stats['avg_score'] or 0, 1),
                 'maximum': stats['max_score'] or 0,
                 'minimum': stats['min_score'] or 0,
-                'total_contacts': contacts.count(),
+                'total_contacts': stats['total'],
             }
         }
+        cache.set(cache_key, result, SCORE_DISTRIBUTION_CACHE_TIMEOUT)
+        return result
 
     # ==================== Export Functions ====================
 
-    def export_campaign_report_csv(self, campaign_id: str) -> str:
+    def export_campaign_report_csv(self, campaign_id: str) -> Iterator[str]:
         """Export campaign report to CSV.
 
         Args:
             campaign_id: Campaign ID
 
         Returns:
-            CSV string
+            Iterator of CSV lines, suitable for a StreamingHttpResponse
         """
         from apps.campaigns.models import CampaignRecipient
 
         recipients = CampaignRecipient.objects.filter(
             campaign_id=campaign_id,
             campaign__workspace_id=self.workspace_id
-        ).select_related('contact')
-
-        output = io.StringIO()
-        writer = csv.writer(output)
+        ).values_list(
+            'contact__email', 'contact__first_name', 'contact__last_name',
+            'contact__company', 'status', 'sent_at', 'opened_at', 'clicked_at',
+            'open_count', 'click_count',
+        )
 
-        # Header
-        writer.writerow([
+        header = [
             'Email', 'First Name', 'Last Name', 'Company',
             'Status', 'Sent At', 'Opened At', 'Clicked At',
             'Open Count', 'Click Count'
-        ])
-
-        # Data
-        for r in recipients:
-            writer.writerow([
-                r.contact.email,
-                r.contact.first_name,
-                r.contact.last_name,
-                r.contact.company,
-                r.status,
-                r.sent_at.isoformat() if r.sent_at else '',
-                r.opened_at.isoformat() if r.opened_at else '',
-                r.clicked_at.isoformat() if r.clicked_at else '',
-                r.open_count,
-                r.click_count,
-            ])
-
-        return output.getvalue()
+        ]
+        rows = (
+            [
+                email, first_name, last_name, company, recipient_status,
+                sent_at.isoformat() if sent_at else '',
+                opened_at.isoformat() if opened_at else '',
+                clicked_at.isoformat() if clicked_at else '',
+                open_count, click_count,
+            ]
+            for (
+                email, first_name, last_name, company, recipient_status,
+                sent_at, opened_at, clicked_at, open_count, click_count,
+            ) in recipients.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        return iter_csv_rows(header, rows)
 
     def export_contacts_csv(
         self,
         filters: Optional[dict] = None,
         fields: Optional[List[str]] = None
-    ) -> str:
+    ) -> Iterator[str]:
         """Export contacts to CSV.
 
         Args:
@@ -594,7 +800,7 @@ class ReportsService:
             fields: Fields to include
 
         Returns:
-            CSV string
+            Iterator of CSV lines, suitable for a StreamingHttpResponse
         """
         from apps.contacts.models import Contact
 
@@ -608,74 +814,97 @@ class ReportsService:
             if filters.get('score_max'):
                 queryset = queryset.filter(score__lte=filters['score_max'])
             if filters.get('is_unsubscribed') is not None:
-                queryset = queryset.filter(is_unsubscribed=filters['is_unsubscribed'])
+                unsubscribed = Q(status=Contact.Status.UNSUBSCRIBED)
+                queryset = queryset.filter(
+                    unsubscribed if filters['is_unsubscribed'] else ~unsubscribed
+                )
 
         default_fields = [
-            'email', 'first_name', 'last_name', 'company', 'title',
-            'phone', 'score', 'is_unsubscribed', 'created_at'
+            'email', 'first_name', 'last_name', 'company', 'job_title',
+            'phone', 'score', 'status', 'created_at'
         ]
         fields = fields or default_fields
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow([f.replace('_', ' ').title() for f in fields])
+        header = [f.replace('_', ' ').title() for f in fields]
+        model_fields = {f.name: f for f in Contact._meta.concrete_fields}
+
+        if not all(f in model_fields for f in fields):
+            # Properties such as full_name need model instances
+            def instance_rows():
+                for contact in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                    row = []
+                    for field in fields:
+                        value = getattr(contact, field, '')
+                        if hasattr(value, 'isoformat'):
+                            value = value.isoformat()
+                        row.append(value)
+                    yield row
+
+            return iter_csv_rows(header, instance_rows())
+
+        # Every field is a column, so plain value tuples are enough
+        columns = list(dict.fromkeys(fields))
+        positions = [columns.index(f) for f in fields]
+        date_columns = [
+            i for i, name in enumerate(columns)
+            if isinstance(model_fields[name], models.DateField)
+        ]
 
-        # Data
-        for contact in queryset:
-            row = []
-            for field in fields:
-                value = getattr(contact, field, '')
-                if hasattr(value, 'isoformat'):
-                    value = value.isoformat()
-                row.append(value)
-            writer.writerow(row)
+        def rows():
+            values_rows = queryset.values_list(*columns).iterator(
+                chunk_size=EXPORT_CHUNK_SIZE
+            )
+            for values in values_rows:
+                values = list(values)
+                for i in date_columns:
+                    if values[i] is not None:
+                        values[i] = values[i].isoformat()
+                yield ['' if values[p] is None else values[p] for p in positions]
 
-        return output.getvalue()
+        return iter_csv_rows(header, rows())
 
-    def export_hot_leads_csv(self, min_score: int = 70) -> str:
+    def export_hot_leads_csv(self, min_score: int = 70) -> Iterator[str]:
         """Export hot leads to CSV.
 
         Args:
             min_score: Minimum score threshold
 
         Returns:
-            CSV string
+            Iterator of CSV lines, suitable for a StreamingHttpResponse
         """
         from apps.contacts.models import Contact
 
         contacts = Contact.objects.filter(
             workspace_id=self.workspace_id,
-            score__gte=min_score,
-            is_unsubscribed=False
+            score__gte=min_score
+        ).exclude(
+            status=Contact.Status.UNSUBSCRIBED
+        ).only(
+            *HOT_LEAD_FIELDS, 'job_title'
         ).order_by('-score')
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        writer.writerow([
+        header = [
             'Email', 'First Name', 'Last Name', 'Company', 'Title',
             'Score', 'Total Opens', 'Total Clicks', 'Total Replies',
             'Last Activity', 'Created At'
-        ])
-
-        for c in contacts:
-            writer.writerow([
+        ]
+        rows = (
+            [
                 c.email,
                 c.first_name,
                 c.last_name,
                 c.company,
-                c.title,
+                c.job_title,
                 c.score,
-                c.total_opens,
-                c.total_clicks,
-                c.total_replies,
-                c.last_activity_at.isoformat() if c.last_activity_at else '',
+                c.emails_opened,
+                c.emails_clicked,
+                c.emails_replied,
+                _last_activity(c).isoformat() if _last_activity(c) else '',
                 c.created_at.isoformat(),
-            ])
-
-        return output.getvalue()
+            ]
+            for c in contacts.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        return iter_csv_rows(header, rows)
 
     # ==================== Performance Summary ====================
 
@@ -691,53 +920,72 @@ class ReportsService:
         from apps.campaigns.models import Campaign
         from apps.contacts.models import Contact
 
+        cache_key = self._cache_key(f'performance_summary:{days}')
+        summary = cache.get(cache_key)
+        if summary is not None:
+            return summary
+
         now = timezone.now()
         current_start = now - timedelta(days=days)
         previous_start = current_start - timedelta(days=days)
 
-        def get_period_stats(start_date, end_date):
-            campaigns = Campaign.objects.filter(
-                workspace_id=self.workspace_id,
-                started_at__gte=start_date,
-                started_at__lt=end_date
-            )
+        periods = {
+            'current': (current_start, now),
+            'previous': (previous_start, current_start),
+        }
 
-            stats = campaigns.aggregate(
-                sent=Sum('sent_count'),
-                opened=Sum('unique_opens'),
-                clicked=Sum('unique_clicks'),
-                replied=Sum('replied_count'),
+        # Both periods come out of one campaign and one contact aggregate
+        campaign_aggregates = {}
+        contact_aggregates = {}
+        for period, (start_date, end_date) in periods.items():
+            started = Q(started_at__gte=start_date, started_at__lt=end_date)
+            sent = Sum('sent_count', filter=started)
+            opened = Sum('unique_opens', filter=started)
+            clicked = Sum('unique_clicks', filter=started)
+            campaign_aggregates.update({
+                f'{period}_sent': sent,
+                f'{period}_opened': opened,
+                f'{period}_clicked': clicked,
+                f'{period}_replied': Sum('replied_count', filter=started),
+                f'{period}_open_rate': _percentage(opened, sent),
+                f'{period}_click_rate': _percentage(clicked, opened),
+            })
+            contact_aggregates[f'{period}_new_contacts'] = Count(
+                'id', filter=Q(created_at__gte=start_date, created_at__lt=end_date)
             )
 
-            new_contacts = Contact.objects.filter(
-                workspace_id=self.workspace_id,
-                created_at__gte=start_date,
-                created_at__lt=end_date
-            ).count()
+        campaign_stats = Campaign.objects.filter(
+            workspace_id=self.workspace_id,
+            started_at__gte=previous_start,
+            started_at__lt=now
+        ).aggregate(**campaign_aggregates)
 
-            sent = stats['sent'] or 0
-            opened = stats['opened'] or 0
-            clicked = stats['clicked'] or 0
+        contact_stats = Contact.objects.filter(
+            workspace_id=self.workspace_id,
+            created_at__gte=previous_start,
+            created_at__lt=now
+        ).aggregate(**contact_aggregates)
 
+        def get_period_stats(period):
             return {
-                'emails_sent': sent,
-                'emails_opened': opened,
-                'emails_clicked': clicked,
-                'replies': stats['replied'] or 0,
-                'new_contacts': new_contacts,
-                'open_rate': round((opened / sent * 100) if sent > 0 else 0, 1),
-                'click_rate': round((clicked / opened * 100) if opened > 0 else 0, 1),
+                'emails_sent': campaign_stats[f'{period}_sent'] or 0,
+                'emails_opened': campaign_stats[f'{period}_opened'] or 0,
+                'emails_clicked': campaign_stats[f'{period}_clicked'] or 0,
+                'replies': campaign_stats[f'{period}_replied'] or 0,
+                'new_contacts': contact_stats[f'{period}_new_contacts'],
+                'open_rate': campaign_stats[f'{period}_open_rate'],
+                'click_rate': campaign_stats[f'{period}_click_rate'],
             }
 
-        current = get_period_stats(current_start, now)
-        previous = get_period_stats(previous_start, current_start)
+        current = get_period_stats('current')
+        previous = get_period_stats('previous')
 
         def calc_change(current_val, previous_val):
             if previous_val == 0:
                 return 100 if current_val > 0 else 0
             return round((current_val - previous_val) / previous_val * 100, 1)
 
-        return {
+        summary = {
             'current': current,
             'previous': previous,
             'changes': {
@@ -750,3 +998,5 @@ class ReportsService:
             },
             'period_days': days,
         }
+        cache.set(cache_key, summary, PERFORMANCE_SUMMARY_CACHE_TIMEOUT)
+        return summary
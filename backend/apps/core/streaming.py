@@ -0,0 +1,31 @@
+"""Helpers for streaming large responses without buffering them in memory."""
+
+import csv
+from typing import Any, Iterable, Iterator, Sequence
+
+
+class Echo:
+    """File-like object that returns written values instead of storing them."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_csv_rows(header: Sequence[Any], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """
+    Yield CSV-encoded lines for a header and an iterable of rows.
+
+    Intended to feed a StreamingHttpResponse so exports are written
+    one row at a time instead of being built up in an in-memory buffer.
+
+    Args:
+        header: Column names for the first line.
+        rows: Iterable of row sequences, typically a values_list iterator.
+
+    Yields:
+        One CSV-encoded line per row, starting with the header.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
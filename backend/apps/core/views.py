@@ -1,23 +1,64 @@
-from django.http import HttpResponse
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils.http import parse_etags, quote_etag
+from django.views.decorators.gzip import gzip_page
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.core.serializers import (
+    ActivityTimelineQuerySerializer,
+    PerformanceQuerySerializer,
+    ReportQuerySerializer,
+)
 from apps.core.services import ReportsService
+from apps.tracking.models import TrackingEvent
+from apps.workspaces.models import Workspace
+
+# Shared validators for report query parameters
+REPORT_QUERY = ReportQuerySerializer()
+PERFORMANCE_QUERY = PerformanceQuerySerializer()
+ACTIVITY_TIMELINE_QUERY = ActivityTimelineQuerySerializer()
+
+# Event types the activity timeline can be filtered by
+TIMELINE_EVENT_TYPES = frozenset(TrackingEvent.EventType.values)
 
 
 def get_workspace_id(request):
-    """Get workspace ID from header or user's first workspace."""
-    workspace_id = get_workspace_id(request)
-    if not workspace_id:
-        return Response({'error': 'No workspace found'}, status=status.HTTP_400_BAD_REQUEST)
-    if not workspace_id:
-        # Fall back to user's first workspace
-        workspace = request.user.workspaces.first()
-        if workspace:
-            workspace_id = str(workspace.id)
-    return workspace_id
+    """Get workspace ID from header, or the user's current or first workspace."""
+    workspace_id = request.headers.get('X-Workspace-ID')
+    if workspace_id:
+        # Only workspaces the user is a member of
+        workspace_id = Workspace.objects.filter(
+            id=workspace_id,
+            members__user=request.user
+        ).values_list('id', flat=True).first()
+    else:
+        workspace_id = request.user.current_workspace_id
+        if not workspace_id:
+            # Fall back to user's first workspace
+            workspace_id = request.user.workspace_memberships.values_list(
+                'workspace_id', flat=True
+            ).first()
+    return str(workspace_id) if workspace_id else None
+
+
+def etag_response(request, data) -> Response:
+    """Respond with `data` and an ETag of its content.
+
+    Returns 304 Not Modified when the client already has this version,
+    so polling clients skip the body.
+    """
+    etag = quote_etag(hashlib.md5(
+        json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder).encode()
+    ).hexdigest())
+    if etag in parse_etags(request.headers.get('If-None-Match', '')):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    return Response(data, headers={'ETag': etag})
 
 
 @api_view(['GET'])
@@ -32,12 +73,12 @@ def dashboard_stats(request):
     workspace_id = get_workspace_id(request)
     if not workspace_id:
         return Response({'error': 'No workspace found'}, status=status.HTTP_400_BAD_REQUEST)
-    days = int(request.query_params.get('days', 30))
+    params = REPORT_QUERY.run_validation(request.query_params)
 
     service = ReportsService(workspace_id)
-    stats = service.get_dashboard_stats(days=days)
+    stats = service.get_dashboard_stats(days=params['days'])
 
-    return Response(stats)
+    return etag_response(request, stats)
 
 
 @api_view(['GET'])
@@ -53,11 +94,13 @@ def email_stats_over_time(request):
     workspace_id = get_workspace_id(request)
     if not workspace_id:
         return Response({'error': 'No workspace found'}, status=status.HTTP_400_BAD_REQUEST)
-    days = int(request.query_params.get('days', 30))
-    granularity = request.query_params.get('granularity', 'day')
+    params = REPORT_QUERY.run_validation(request.query_params)
 
     service = ReportsService(workspace_id)
-    stats = service.get_email_stats_over_time(days=days, granularity=granularity)
+    stats = service.get_email_stats_over_time(
+        days=params['days'],
+        granularity=params['granularity']
+    )
 
     return Response(stats)
 
@@ -76,12 +119,12 @@ def campaign_report(request, campaign_id):
     service = ReportsService(workspace_id)
     try:
         report = service.get_campaign_report(campaign_id)
-        return Response(report)
     except Exception as e:
         return Response(
             {'error': str(e)},
             status=status.HTTP_404_NOT_FOUND
         )
+    return etag_response(request, report)
 
 
 @api_view(['POST'])
@@ -116,7 +159,8 @@ def activity_timeline(request):
 
     GET /api/v1/reports/activity/
     Query params:
-        - limit: Max events (default: 50)
+        - limit: Max events (default: 50, at most 500)
+        - after: ID of the last event of the previous page
         - event_types: Comma-separated event types
         - contact_id: Filter by contact
         - campaign_id: Filter by campaign
@@ -124,17 +168,21 @@ def activity_timeline(request):
     workspace_id = get_workspace_id(request)
     if not workspace_id:
         return Response({'error': 'No workspace found'}, status=status.HTTP_400_BAD_REQUEST)
-    limit = int(request.query_params.get('limit', 50))
+    params = ACTIVITY_TIMELINE_QUERY.run_validation(request.query_params)
     event_types = request.query_params.get('event_types')
     contact_id = request.query_params.get('contact_id')
     campaign_id = request.query_params.get('campaign_id')
 
     if event_types:
-        event_types = event_types.split(',')
+        # Unknown types are dropped; if none are left nothing can match
+        event_types = TIMELINE_EVENT_TYPES.intersection(event_types.split(','))
+        if not event_types:
+            return Response([])
 
     service = ReportsService(workspace_id)
     timeline = service.get_activity_timeline(
-        limit=limit,
+        limit=params['limit'],
+        after=params.get('after'),
         event_types=event_types,
         contact_id=contact_id,
         campaign_id=campaign_id,
@@ -156,14 +204,13 @@ def hot_leads_report(request):
     workspace_id = get_workspace_id(request)
     if not workspace_id:
         return Response({'error': 'No workspace found'}, status=status.HTTP_400_BAD_REQUEST)
-    limit = int(request.query_params.get('limit', 50))
-    min_score = request.query_params.get('min_score')
-
-    if min_score:
-        min_score = int(min_score)
+    params = REPORT_QUERY.run_validation(request.query_params)
 
     service = ReportsService(workspace_id)
-    report = service.get_hot_leads_report(limit=limit, min_score=min_score)
+    report = service.get_hot_leads_report(
+        limit=params['limit'],
+        min_score=params.get('min_score')
+    )
 
     return Response(report)
 
@@ -182,7 +229,7 @@ def score_distribution(request):
     service = ReportsService(workspace_id)
     distribution = service.get_score_distribution()
 
-    return Response(distribution)
+    return etag_response(request, distribution)
 
 
 @api_view(['GET'])
@@ -197,16 +244,17 @@ def performance_summary(request):
     workspace_id = get_workspace_id(request)
     if not workspace_id:
         return Response({'error': 'No workspace found'}, status=status.HTTP_400_BAD_REQUEST)
-    days = int(request.query_params.get('days', 7))
+    params = PERFORMANCE_QUERY.run_validation(request.query_params)
 
     service = ReportsService(workspace_id)
-    summary = service.get_performance_summary(days=days)
+    summary = service.get_performance_summary(days=params['days'])
 
     return Response(summary)
 
 
 # ==================== Export Endpoints ====================
 
+@gzip_page
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def export_campaign_report(request, campaign_id):
@@ -219,14 +267,15 @@ def export_campaign_report(request, campaign_id):
         return Response({'error': 'No workspace found'}, status=status.HTTP_400_BAD_REQUEST)
 
     service = ReportsService(workspace_id)
-    csv_data = service.export_campaign_report_csv(campaign_id)
+    csv_rows = service.export_campaign_report_csv(campaign_id)
 
-    response = HttpResponse(csv_data, content_type='text/csv')
+    response = StreamingHttpResponse(csv_rows, content_type='text/csv')
     response['Content-Disposition'] = f'attachment; filename="campaign_{campaign_id}_report.csv"'
 
     return response
 
 
+@gzip_page
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def export_contacts(request):
@@ -245,14 +294,15 @@ def export_contacts(request):
     fields = request.data.get('fields')
 
     service = ReportsService(workspace_id)
-    csv_data = service.export_contacts_csv(filters=filters, fields=fields)
+    csv_rows = service.export_contacts_csv(filters=filters, fields=fields)
 
-    response = HttpResponse(csv_data, content_type='text/csv')
+    response = StreamingHttpResponse(csv_rows, content_type='text/csv')
     response['Content-Disposition'] = 'attachment; filename="contacts_export.csv"'
 
     return response
 
 
+@gzip_page
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def export_hot_leads(request):
@@ -265,12 +315,12 @@ def export_hot_leads(request):
     workspace_id = get_workspace_id(request)
     if not workspace_id:
         return Response({'error': 'No workspace found'}, status=status.HTTP_400_BAD_REQUEST)
-    min_score = int(request.query_params.get('min_score', 70))
+    params = REPORT_QUERY.run_validation(request.query_params)
 
     service = ReportsService(workspace_id)
-    csv_data = service.export_hot_leads_csv(min_score=min_score)
+    csv_rows = service.export_hot_leads_csv(min_score=params.get('min_score', 70))
 
-    response = HttpResponse(csv_data, content_type='text/csv')
+    response = StreamingHttpResponse(csv_rows, content_type='text/csv')
     response['Content-Disposition'] = 'attachment; filename="hot_leads.csv"'
 
     return response
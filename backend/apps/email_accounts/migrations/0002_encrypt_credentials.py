@@ -0,0 +1,46 @@
+import apps.core.fields
+from django.db import migrations
+
+ENCRYPTED_FIELDS = ['smtp_password', 'imap_password', 'oauth_access_token', 'oauth_refresh_token']
+
+
+def encrypt_existing_credentials(apps, schema_editor):
+    """Rewrite stored credentials so plaintext values are encrypted."""
+    EmailAccount = apps.get_model('email_accounts', 'EmailAccount')
+
+    accounts = EmailAccount.objects.only('pk', *ENCRYPTED_FIELDS)
+    for account in accounts.iterator(chunk_size=500):
+        EmailAccount.objects.filter(pk=account.pk).update(**{
+            field: getattr(account, field) for field in ENCRYPTED_FIELDS
+        })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('email_accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emailaccount',
+            name='smtp_password',
+            field=apps.core.fields.EncryptedCharField(blank=True, max_length=1000),
+        ),
+        migrations.AlterField(
+            model_name='emailaccount',
+            name='imap_password',
+            field=apps.core.fields.EncryptedCharField(blank=True, max_length=1000),
+        ),
+        migrations.AlterField(
+            model_name='emailaccount',
+            name='oauth_access_token',
+            field=apps.core.fields.EncryptedTextField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name='emailaccount',
+            name='oauth_refresh_token',
+            field=apps.core.fields.EncryptedTextField(blank=True),
+        ),
+        migrations.RunPython(encrypt_existing_credentials, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('email_accounts', '0002_encrypt_credentials'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailaccount',
+            index=models.Index(fields=['user', '-created_at'], name='email_accou_user_id_dab5b7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='emailaccountlog',
+            index=models.Index(fields=['email_account', '-created_at'], name='email_accou_email_a_c350ff_idx'),
+        ),
+    ]
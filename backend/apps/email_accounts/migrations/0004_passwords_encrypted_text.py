@@ -0,0 +1,22 @@
+import apps.core.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('email_accounts', '0003_emailaccount_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emailaccount',
+            name='smtp_password',
+            field=apps.core.fields.EncryptedTextField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name='emailaccount',
+            name='imap_password',
+            field=apps.core.fields.EncryptedTextField(blank=True),
+        ),
+    ]
@@ -1,10 +1,17 @@
 from django.db import models
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Least
 from django.conf import settings
 from django.utils import timezone
 
+from apps.core.fields import EncryptedTextField
 from apps.core.models import BaseModel
 
 
+# Encrypted credential columns, which only sending and connection code reads
+CREDENTIAL_FIELDS = ('smtp_password', 'imap_password', 'oauth_access_token', 'oauth_refresh_token')
+
+
 class EmailAccount(BaseModel):
     """Email account for sending campaigns."""
 
@@ -46,7 +53,7 @@ class EmailAccount(BaseModel):
     smtp_host = models.CharField(max_length=255, blank=True)
     smtp_port = models.IntegerField(default=587)
     smtp_username = models.CharField(max_length=255, blank=True)
-    smtp_password = models.CharField(max_length=500, blank=True)  # Encrypted
+    smtp_password = EncryptedTextField(blank=True)
     smtp_use_tls = models.BooleanField(default=True)
     smtp_use_ssl = models.BooleanField(default=False)
 
@@ -54,12 +61,12 @@ class EmailAccount(BaseModel):
     imap_host = models.CharField(max_length=255, blank=True)
     imap_port = models.IntegerField(default=993)
     imap_username = models.CharField(max_length=255, blank=True)
-    imap_password = models.CharField(max_length=500, blank=True)  # Encrypted
+    imap_password = EncryptedTextField(blank=True)
     imap_use_ssl = models.BooleanField(default=True)
 
     # OAuth tokens (for Gmail/Outlook)
-    oauth_access_token = models.TextField(blank=True)
-    oauth_refresh_token = models.TextField(blank=True)
+    oauth_access_token = EncryptedTextField(blank=True)
+    oauth_refresh_token = EncryptedTextField(blank=True)
     oauth_token_expires_at = models.DateTimeField(null=True, blank=True)
 
     # Sender identity
@@ -94,6 +101,9 @@ class EmailAccount(BaseModel):
         db_table = 'email_accounts'
         ordering = ['-created_at']
         unique_together = ['user', 'email']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.email})"
@@ -102,28 +112,24 @@ class EmailAccount(BaseModel):
     def is_oauth(self):
         return self.provider in [self.Provider.GMAIL, self.Provider.OUTLOOK]
 
+    @property
+    def effective_daily_limit(self):
+        """Today's sending limit, lowered while the account is warming up."""
+        return self.warmup_current_limit if self.is_warming_up else self.daily_limit
+
     @property
     def can_send(self):
         """Check if this account can send emails right now."""
-        if self.status != self.Status.ACTIVE:
-            return False
-
-        # Check daily limit
-        effective_daily_limit = self.warmup_current_limit if self.is_warming_up else self.daily_limit
-        if self.emails_sent_today >= effective_daily_limit:
-            return False
-
-        # Check hourly limit
-        if self.emails_sent_this_hour >= self.hourly_limit:
-            return False
-
-        return True
+        return (
+            self.status == self.Status.ACTIVE
+            and self.remaining_today > 0
+            and self.remaining_this_hour > 0
+        )
 
     @property
     def remaining_today(self):
         """Get remaining emails that can be sent today."""
-        effective_limit = self.warmup_current_limit if self.is_warming_up else self.daily_limit
-        return max(0, effective_limit - self.emails_sent_today)
+        return max(0, self.effective_daily_limit - self.emails_sent_today)
 
     @property
     def remaining_this_hour(self):
@@ -134,38 +140,84 @@ class EmailAccount(BaseModel):
         """Reset hourly email counter."""
         self.emails_sent_this_hour = 0
         self.last_hour_reset = timezone.now()
-        self.save(update_fields=['emails_sent_this_hour', 'last_hour_reset'])
+        EmailAccount.objects.filter(pk=self.pk).update(
+            emails_sent_this_hour=0,
+            last_hour_reset=self.last_hour_reset,
+        )
+
+    @classmethod
+    def reset_all_hourly(cls) -> int:
+        """Reset the hourly counter of every account in one UPDATE."""
+        return cls.objects.update(
+            emails_sent_this_hour=0,
+            last_hour_reset=timezone.now(),
+        )
+
+    @staticmethod
+    def _daily_reset_values(now) -> dict:
+        """UPDATE values that reset the daily counter and advance warmup.
+
+        The warmup limit grows by the daily increase, stopping once it
+        reaches the daily limit. Both CASEs read the pre-update row.
+        """
+        warmup_done = Q(is_warming_up=True) & Q(
+            daily_limit__lte=F('warmup_current_limit') + F('warmup_daily_increase')
+        )
+        return {
+            'emails_sent_today': 0,
+            'last_day_reset': now,
+            'warmup_current_limit': Case(
+                When(is_warming_up=True, then=Least(
+                    F('warmup_current_limit') + F('warmup_daily_increase'),
+                    F('daily_limit')
+                )),
+                default=F('warmup_current_limit'),
+            ),
+            'is_warming_up': Case(
+                When(warmup_done, then=Value(False)),
+                default=F('is_warming_up'),
+            ),
+        }
+
+    @classmethod
+    def reset_all_daily(cls) -> int:
+        """Reset the daily counter of every account in one UPDATE."""
+        return cls.objects.update(**cls._daily_reset_values(timezone.now()))
 
     def reset_daily_counter(self):
         """Reset daily email counter and update warmup limit."""
         self.emails_sent_today = 0
         self.last_day_reset = timezone.now()
+        EmailAccount.objects.filter(pk=self.pk).update(
+            **self._daily_reset_values(self.last_day_reset)
+        )
 
-        # Increase warmup limit if warming up
+        # Mirror the update on this instance
         if self.is_warming_up:
             self.warmup_current_limit = min(
                 self.warmup_current_limit + self.warmup_daily_increase,
                 self.daily_limit
             )
-            # Stop warmup if we've reached the daily limit
             if self.warmup_current_limit >= self.daily_limit:
                 self.is_warming_up = False
 
-        self.save(update_fields=[
-            'emails_sent_today', 'last_day_reset',
-            'warmup_current_limit', 'is_warming_up'
-        ])
+    def increment_sent_count(self, count: int = 1):
+        """Increment sent counters after sending `count` emails.
 
-    def increment_sent_count(self):
-        """Increment sent counters after sending an email."""
-        self.emails_sent_today += 1
-        self.emails_sent_this_hour += 1
-        self.total_emails_sent += 1
+        The counters are bumped atomically in the database so concurrent
+        senders on the same account do not lose increments; this instance
+        is updated in step without re-reading the row.
+        """
         self.last_email_sent_at = timezone.now()
-        self.save(update_fields=[
-            'emails_sent_today', 'emails_sent_this_hour',
-            'total_emails_sent', 'last_email_sent_at'
-        ])
+        EmailAccount.objects.filter(pk=self.pk).update(
+            emails_sent_today=F('emails_sent_today') + count,
+            emails_sent_this_hour=F('emails_sent_this_hour') + count,
+            total_emails_sent=F('total_emails_sent') + count,
+            last_email_sent_at=self.last_email_sent_at,
+        )
+        self.emails_sent_today += count
+        self.emails_sent_this_hour += count
+        self.total_emails_sent += count
 
 
 class EmailAccountLog(BaseModel):
@@ -192,6 +244,9 @@ class EmailAccountLog(BaseModel):
     class Meta:
         db_table = 'email_account_logs'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['email_account', '-created_at']),
+        ]
 
     def __str__(self):
         return f"{self.email_account.email} - {self.log_type} - {self.created_at}"
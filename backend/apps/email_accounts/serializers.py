@@ -3,6 +3,14 @@ from rest_framework import serializers
 from .models import EmailAccount, EmailAccountLog
 
 
+# Fields an SMTP account must provide, with their labels for errors
+SMTP_REQUIRED_FIELDS = (
+    ('smtp_host', 'SMTP host'),
+    ('smtp_username', 'SMTP username'),
+    ('smtp_password', 'SMTP password'),
+)
+
+
 class EmailAccountSerializer(serializers.ModelSerializer):
     """Serializer for EmailAccount model."""
 
@@ -49,27 +57,23 @@ class EmailAccountCreateSerializer(serializers.ModelSerializer):
             'daily_limit', 'hourly_limit',
         ]
         extra_kwargs = {
-            'smtp_password': {'write_only': True},
-            'imap_password': {'write_only': True},
+            'smtp_password': {'write_only': True, 'max_length': 1000},
+            'imap_password': {'write_only': True, 'max_length': 1000},
         }
 
     def validate(self, data):
         provider = data.get('provider', EmailAccount.Provider.SMTP)
 
-        # For SMTP provider, require SMTP configuration
+        # For SMTP provider, require SMTP configuration, reporting every
+        # missing field at once
         if provider == EmailAccount.Provider.SMTP:
-            if not data.get('smtp_host'):
-                raise serializers.ValidationError({
-                    'smtp_host': 'SMTP host is required for SMTP provider.'
-                })
-            if not data.get('smtp_username'):
-                raise serializers.ValidationError({
-                    'smtp_username': 'SMTP username is required for SMTP provider.'
-                })
-            if not data.get('smtp_password'):
-                raise serializers.ValidationError({
-                    'smtp_password': 'SMTP password is required for SMTP provider.'
-                })
+            errors = {
+                field: f'{label} is required for SMTP provider.'
+                for field, label in SMTP_REQUIRED_FIELDS
+                if not data.get(field)
+            }
+            if errors:
+                raise serializers.ValidationError(errors)
 
         return data
 
@@ -94,8 +98,8 @@ class EmailAccountUpdateSerializer(serializers.ModelSerializer):
             'is_warming_up', 'warmup_daily_increase', 'warmup_current_limit',
         ]
         extra_kwargs = {
-            'smtp_password': {'write_only': True, 'required': False},
-            'imap_password': {'write_only': True, 'required': False},
+            'smtp_password': {'write_only': True, 'required': False, 'max_length': 1000},
+            'imap_password': {'write_only': True, 'required': False, 'max_length': 1000},
         }
 
     def update(self, instance, validated_data):
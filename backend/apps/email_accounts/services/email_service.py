@@ -1,14 +1,30 @@
 import smtplib
 import imaplib
 import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, Tuple
+from email.policy import compat32
+from email.utils import make_msgid
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
+from celery.signals import worker_process_shutdown
+from django.db import connections, transaction
 from django.utils import timezone
 
 from apps.email_accounts.models import EmailAccount, EmailAccountLog
+from apps.email_accounts.services.log_buffer import save_logs
+
+
+# Message serialization policy: the MIME classes' default, with the CRLF
+# line endings SMTP expects on the wire
+SMTP_POLICY = compat32.clone(linesep='\r\n')
+
+# Logged-in SMTP sessions reused across sends, per thread and per account:
+# {account_pk: (settings_key, server)}
+_smtp_sessions = threading.local()
 
 
 @dataclass
@@ -36,42 +52,25 @@ class EmailService:
     def test_smtp_connection(self) -> ConnectionResult:
         """Test SMTP connection."""
         try:
-            if self.account.smtp_use_ssl:
-                context = ssl.create_default_context()
-                server = smtplib.SMTP_SSL(
-                    self.account.smtp_host,
-                    self.account.smtp_port,
-                    context=context,
-                    timeout=30
-                )
-            else:
-                server = smtplib.SMTP(
-                    self.account.smtp_host,
-                    self.account.smtp_port,
-                    timeout=30
-                )
-                if self.account.smtp_use_tls:
-                    server.starttls()
-
-            server.login(self.account.smtp_username, self.account.smtp_password)
+            server = self._connect_smtp()
             server.quit()
 
-            # Update account status
-            self.account.last_connection_test = timezone.now()
-            self.account.last_connection_success = True
-            self.account.last_connection_error = ''
-            self.account.status = EmailAccount.Status.ACTIVE
-            self.account.save(update_fields=[
-                'last_connection_test', 'last_connection_success',
-                'last_connection_error', 'status'
-            ])
-
-            # Log success
-            self._log(
-                EmailAccountLog.LogType.CONNECTION_TEST,
-                "SMTP connection successful",
-                is_success=True
-            )
+            # Update account status and log success together
+            with transaction.atomic():
+                self.account.last_connection_test = timezone.now()
+                self.account.last_connection_success = True
+                self.account.last_connection_error = ''
+                self.account.status = EmailAccount.Status.ACTIVE
+                self.account.save(update_fields=[
+                    'last_connection_test', 'last_connection_success',
+                    'last_connection_error', 'status'
+                ])
+
+                self._log(
+                    EmailAccountLog.LogType.CONNECTION_TEST,
+                    "SMTP connection successful",
+                    is_success=True
+                )
 
             return ConnectionResult(
                 success=True,
@@ -93,6 +92,29 @@ class EmailService:
             self._handle_connection_error(error_msg)
             return ConnectionResult(success=False, message=error_msg)
 
+    def test_connections(self, smtp: bool = True, imap: bool = False) -> dict:
+        """Test SMTP and/or IMAP connections.
+
+        When both are requested the IMAP test runs on a worker thread, so
+        the two handshakes overlap instead of running back to back.
+
+        Returns:
+            Dict of ConnectionResult keyed by 'smtp' and 'imap'
+        """
+        results = {}
+
+        if smtp and imap:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                imap_future = executor.submit(_closing_db_connections, self.test_imap_connection)
+                results['smtp'] = self.test_smtp_connection()
+                results['imap'] = imap_future.result()
+        elif smtp:
+            results['smtp'] = self.test_smtp_connection()
+        elif imap:
+            results['imap'] = self.test_imap_connection()
+
+        return results
+
     def test_imap_connection(self) -> ConnectionResult:
         """Test IMAP connection."""
         if not self.account.imap_host:
@@ -149,102 +171,242 @@ class EmailService:
         headers: Optional[dict] = None
     ) -> SendResult:
         """Send an email."""
-
-        # Check if can send
-        if not self.account.can_send:
-            self._log(
-                EmailAccountLog.LogType.LIMIT_REACHED,
-                "Cannot send: limit reached or account not active",
-                is_success=False
+        return self.send_batch([{
+            'to_email': to_email,
+            'subject': subject,
+            'html_body': html_body,
+            'text_body': text_body,
+            'reply_to': reply_to,
+            'headers': headers,
+        }])[0]
+
+    def send_batch(self, messages: List[dict]) -> List[SendResult]:
+        """Send several emails over one SMTP session.
+
+        Each message is a dict of `send_email` keyword arguments. Messages
+        beyond the account's remaining hourly/daily allowance are not sent.
+        Logs are written with one bulk insert and the sent counters with
+        one UPDATE once the batch is done.
+
+        Returns:
+            One SendResult per message, in order.
+        """
+        allowance = min(self.account.remaining_today, self.account.remaining_this_hour)
+        if self.account.status != EmailAccount.Status.ACTIVE:
+            allowance = 0
+
+        # Account headers are the same for every message in the batch
+        envelope = self._envelope()
+
+        results = []
+        logs = []
+        sent = 0
+
+        for message in messages:
+            to_email = message['to_email']
+            subject = message['subject']
+
+            if sent >= allowance:
+                error_msg = "Cannot send: limit reached or account not active"
+                logs.append(self._log_entry(
+                    EmailAccountLog.LogType.LIMIT_REACHED,
+                    error_msg,
+                    is_success=False
+                ))
+                results.append(SendResult(success=False, message=error_msg))
+                continue
+
+            try:
+                msg = self._build_message(envelope, **message)
+                # Serialized once with CRLF line endings, so smtplib sends
+                # the bytes as-is instead of re-encoding a str
+                payload = msg.as_bytes(policy=SMTP_POLICY)
+
+                # Send over the pooled session; if the server dropped it
+                # since the liveness check, reconnect once and retry
+                try:
+                    self._get_smtp().sendmail(self.account.email, [to_email], payload)
+                except smtplib.SMTPServerDisconnected:
+                    self._discard_smtp()
+                    self._get_smtp().sendmail(self.account.email, [to_email], payload)
+
+                sent += 1
+                logs.append(self._log_entry(
+                    EmailAccountLog.LogType.EMAIL_SENT,
+                    f"Email sent to {to_email}",
+                    details={'to': to_email, 'subject': subject},
+                    is_success=True
+                ))
+                results.append(SendResult(
+                    success=True,
+                    message="Email sent successfully",
+                    message_id=msg.get('Message-ID')
+                ))
+
+            except Exception as e:
+                error_msg = f"Failed to send email: {str(e)}"
+                logs.append(self._log_entry(
+                    EmailAccountLog.LogType.EMAIL_FAILED,
+                    error_msg,
+                    details={'to': to_email, 'subject': subject, 'error': str(e)},
+                    is_success=False
+                ))
+                results.append(SendResult(success=False, message=error_msg))
+
+        # Update counters
+        if sent:
+            self.account.increment_sent_count(sent)
+
+        # Successful sends are the high-volume entries and may be deferred
+        # to the end of the task; failures are written straight away
+        failures = []
+        sent_logs = []
+        for entry in logs:
+            if entry.log_type == EmailAccountLog.LogType.EMAIL_SENT:
+                sent_logs.append(entry)
+            else:
+                failures.append(entry)
+        if failures:
+            EmailAccountLog.objects.bulk_create(failures, batch_size=500)
+        save_logs(sent_logs)
+
+        return results
+
+    def _envelope(self) -> dict:
+        """Header values taken from the account rather than the message."""
+        return {
+            'from': f"{self.account.from_name} <{self.account.email}>" if self.account.from_name else self.account.email,
+            'reply_to': self.account.reply_to or self.account.email,
+            'domain': self.account.email.rpartition('@')[2] or None,
+        }
+
+    def _build_message(
+        self,
+        envelope: dict,
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+        reply_to: Optional[str] = None,
+        headers: Optional[dict] = None
+    ) -> MIMEMultipart:
+        """Build the MIME message for one email."""
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = envelope['from']
+        msg['To'] = to_email
+        msg['Reply-To'] = reply_to or envelope['reply_to']
+        msg['Message-ID'] = make_msgid(domain=envelope['domain'])
+
+        # Add custom headers
+        if headers:
+            for key, value in headers.items():
+                msg[key] = value
+
+        # Add body
+        if text_body:
+            msg.attach(MIMEText(text_body, 'plain'))
+        msg.attach(MIMEText(html_body, 'html'))
+
+        return msg
+
+    def _connect_smtp(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP session for this account."""
+        if self.account.smtp_use_ssl:
+            context = ssl.create_default_context()
+            server = smtplib.SMTP_SSL(
+                self.account.smtp_host,
+                self.account.smtp_port,
+                context=context,
+                timeout=30
             )
-            return SendResult(
-                success=False,
-                message="Cannot send: limit reached or account not active"
+        else:
+            server = smtplib.SMTP(
+                self.account.smtp_host,
+                self.account.smtp_port,
+                timeout=30
             )
+            if self.account.smtp_use_tls:
+                server.starttls()
 
-        try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = f"{self.account.from_name} <{self.account.email}>" if self.account.from_name else self.account.email
-            msg['To'] = to_email
-            msg['Reply-To'] = reply_to or self.account.reply_to or self.account.email
-
-            # Add custom headers
-            if headers:
-                for key, value in headers.items():
-                    msg[key] = value
-
-            # Add body
-            if text_body:
-                msg.attach(MIMEText(text_body, 'plain'))
-            msg.attach(MIMEText(html_body, 'html'))
-
-            # Connect and send
-            if self.account.smtp_use_ssl:
-                context = ssl.create_default_context()
-                server = smtplib.SMTP_SSL(
-                    self.account.smtp_host,
-                    self.account.smtp_port,
-                    context=context,
-                    timeout=30
-                )
-            else:
-                server = smtplib.SMTP(
-                    self.account.smtp_host,
-                    self.account.smtp_port,
-                    timeout=30
-                )
-                if self.account.smtp_use_tls:
-                    server.starttls()
+        server.login(self.account.smtp_username, self.account.smtp_password)
+        return server
 
-            server.login(self.account.smtp_username, self.account.smtp_password)
-            server.sendmail(self.account.email, [to_email], msg.as_string())
-            server.quit()
+    def _smtp_settings_key(self) -> tuple:
+        return (
+            self.account.smtp_host, self.account.smtp_port,
+            self.account.smtp_username, self.account.smtp_password,
+            self.account.smtp_use_ssl, self.account.smtp_use_tls,
+        )
 
-            # Update counters
-            self.account.increment_sent_count()
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return this thread's live SMTP session for the account.
+
+        Reuses the pooled session when its settings are unchanged and it
+        still answers NOOP; otherwise logs in again and pools the new one.
+        """
+        sessions = _smtp_sessions.__dict__.setdefault('sessions', {})
+        key = self._smtp_settings_key()
+
+        pooled = sessions.get(self.account.pk)
+        if pooled is not None:
+            pooled_key, server = pooled
+            if pooled_key == key:
+                try:
+                    if server.noop()[0] == 250:
+                        return server
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._discard_smtp()
+
+        server = self._connect_smtp()
+        sessions[self.account.pk] = (key, server)
+        return server
+
+    def ensure_connected(self):
+        """Make sure a logged-in SMTP session for the account is open.
+
+        Raises:
+            smtplib.SMTPException, OSError: If the server can't be reached
+                or rejects the login.
+        """
+        self._get_smtp()
+
+    def _discard_smtp(self):
+        """Drop and close this thread's pooled session for the account."""
+        sessions = _smtp_sessions.__dict__.get('sessions', {})
+        pooled = sessions.pop(self.account.pk, None)
+        if pooled is not None:
+            _close_quietly(pooled[1])
+
+    @staticmethod
+    def close_connections():
+        """Close every pooled SMTP session held by the current thread."""
+        sessions = _smtp_sessions.__dict__.pop('sessions', {})
+        for _, server in sessions.values():
+            _close_quietly(server)
 
-            # Log success
-            self._log(
-                EmailAccountLog.LogType.EMAIL_SENT,
-                f"Email sent to {to_email}",
-                details={'to': to_email, 'subject': subject},
-                is_success=True
-            )
+    def _handle_connection_error(self, error_msg: str):
+        """Handle connection error.
 
-            return SendResult(
-                success=True,
-                message="Email sent successfully",
-                message_id=msg.get('Message-ID')
-            )
+        The account status and its log entry are written in one
+        transaction, so the latest log always matches the stored status.
+        """
+        with transaction.atomic():
+            self.account.last_connection_test = timezone.now()
+            self.account.last_connection_success = False
+            self.account.last_connection_error = error_msg
+            self.account.status = EmailAccount.Status.ERROR
+            self.account.save(update_fields=[
+                'last_connection_test', 'last_connection_success',
+                'last_connection_error', 'status'
+            ])
 
-        except Exception as e:
-            error_msg = f"Failed to send email: {str(e)}"
             self._log(
-                EmailAccountLog.LogType.EMAIL_FAILED,
+                EmailAccountLog.LogType.CONNECTION_TEST,
                 error_msg,
-                details={'to': to_email, 'subject': subject, 'error': str(e)},
                 is_success=False
             )
-            return SendResult(success=False, message=error_msg)
-
-    def _handle_connection_error(self, error_msg: str):
-        """Handle connection error."""
-        self.account.last_connection_test = timezone.now()
-        self.account.last_connection_success = False
-        self.account.last_connection_error = error_msg
-        self.account.status = EmailAccount.Status.ERROR
-        self.account.save(update_fields=[
-            'last_connection_test', 'last_connection_success',
-            'last_connection_error', 'status'
-        ])
-
-        self._log(
-            EmailAccountLog.LogType.CONNECTION_TEST,
-            error_msg,
-            is_success=False
-        )
 
     def _log(
         self,
@@ -254,10 +416,42 @@ class EmailService:
         is_success: bool = True
     ):
         """Create a log entry."""
-        EmailAccountLog.objects.create(
+        self._log_entry(log_type, message, details, is_success).save()
+
+    def _log_entry(
+        self,
+        log_type: str,
+        message: str,
+        details: dict = None,
+        is_success: bool = True
+    ) -> EmailAccountLog:
+        """Build an unsaved log entry, for bulk inserts."""
+        return EmailAccountLog(
             email_account=self.account,
             log_type=log_type,
             message=message,
             details=details or {},
             is_success=is_success
         )
+
+
+def _closing_db_connections(func):
+    """Call `func` on a worker thread, closing the thread's DB connections after."""
+    try:
+        return func()
+    finally:
+        connections.close_all()
+
+
+def _close_quietly(server: smtplib.SMTP):
+    """QUIT an SMTP session, ignoring errors from an already dead link."""
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+@worker_process_shutdown.connect
+def _close_smtp_connections(**kwargs):
+    EmailService.close_connections()
+
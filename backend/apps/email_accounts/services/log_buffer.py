@@ -0,0 +1,68 @@
+"""Batched writes of high-volume EmailAccountLog entries.
+
+Every successful send logs a row. Inside a Celery task those rows are
+queued here and written with one bulk insert when the task finishes (or
+once FLUSH_SIZE entries are pending); outside a task they are written
+straight away. Queued entries are lost if the worker process is killed
+outright, so only route logs here that are acceptable to lose.
+"""
+
+import atexit
+import threading
+from typing import Iterable
+
+from celery import current_task
+from celery.signals import task_postrun, worker_process_shutdown
+
+from apps.email_accounts.models import EmailAccountLog
+
+
+FLUSH_SIZE = 500
+
+_entries: list = []
+_lock = threading.Lock()
+
+
+def save_logs(entries: Iterable[EmailAccountLog]):
+    """Save unsaved log entries, deferring the insert while in a Celery task."""
+    entries = list(entries)
+    if not entries:
+        return
+
+    if not current_task:
+        EmailAccountLog.objects.bulk_create(entries, batch_size=FLUSH_SIZE)
+        return
+
+    with _lock:
+        _entries.extend(entries)
+        full = len(_entries) >= FLUSH_SIZE
+    if full:
+        flush_logs()
+
+
+def flush_logs():
+    """Write all queued log entries."""
+    global _entries
+
+    # Cheap exit for the common case, without taking the lock
+    if not _entries:
+        return
+
+    with _lock:
+        entries, _entries = _entries, []
+    if entries:
+        EmailAccountLog.objects.bulk_create(entries, batch_size=FLUSH_SIZE)
+
+
+@task_postrun.connect
+def _flush_after_task(**kwargs):
+    flush_logs()
+
+
+# Prefork pool children exit without running atexit handlers
+@worker_process_shutdown.connect
+def _flush_on_worker_shutdown(**kwargs):
+    flush_logs()
+
+
+atexit.register(flush_logs)
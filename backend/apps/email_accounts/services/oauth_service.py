@@ -1,13 +1,19 @@
 import os
 import json
 import base64
-from typing import Optional, Tuple
+import threading
+import time
+import weakref
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
+from google.auth import jwt
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
@@ -15,10 +21,32 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 import msal
+import requests
 
 from apps.email_accounts.models import EmailAccount, EmailAccountLog
 
 
+# Tokens are refreshed this long before they expire
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Sends per Gmail batch request (Gmail advises at most 50) and per Graph
+# $batch request (Graph allows at most 20)
+GMAIL_BATCH_SIZE = 50
+GRAPH_BATCH_SIZE = 20
+
+# Longest a refresh may hold the cross-process lock (seconds)
+REFRESH_LOCK_TIMEOUT = 30
+
+# Per-account locks serializing token refreshes within this process. Weakly
+# held: an entry lives only while some caller is holding or waiting on it
+_refresh_locks = weakref.WeakValueDictionary()
+_refresh_locks_guard = threading.Lock()
+
+# API clients reused across sends, per thread: Gmail services per account
+# as {account_pk: (access_token, service)}, and one Graph HTTP session
+_api_clients = threading.local()
+
+
 @dataclass
 class OAuthResult:
     """Result of OAuth operation."""
@@ -27,15 +55,79 @@ class OAuthResult:
     data: dict = None
 
 
+@lru_cache(maxsize=8)
+def _msal_app(client_id: str, authority: str, client_secret: str) -> msal.ConfidentialClientApplication:
+    """Process-wide MSAL application per client configuration."""
+    return msal.ConfidentialClientApplication(
+        client_id,
+        authority=authority,
+        client_credential=client_secret,
+    )
+
+
+def _graph_session() -> requests.Session:
+    """This thread's keep-alive HTTP session for Microsoft Graph."""
+    session = getattr(_api_clients, 'graph', None)
+    if session is None:
+        session = _api_clients.graph = requests.Session()
+    return session
+
+
+def _needs_refresh(email_account: EmailAccount) -> bool:
+    """Whether the account's access token expires within the refresh margin."""
+    expires_at = email_account.oauth_token_expires_at
+    return bool(expires_at) and timezone.now() >= expires_at - TOKEN_REFRESH_MARGIN
+
+
+def _reload_tokens(email_account: EmailAccount):
+    """Re-read the account's tokens, which another worker may have refreshed."""
+    fields = ['oauth_access_token', 'oauth_refresh_token', 'oauth_token_expires_at']
+    email_account.refresh_from_db(fields=fields)
+
+
+def _refresh_once(email_account: EmailAccount, refresh) -> OAuthResult:
+    """Refresh the account's token with `refresh`, unless another caller does.
+
+    Concurrent refreshes of one account are collapsed into one: callers in
+    this process queue on a per-account lock, and processes race for a
+    cache lock (SET NX on Redis). Callers that lose re-read the tokens and
+    use the refreshed ones instead of calling the identity provider again.
+    """
+    with _refresh_locks_guard:
+        lock = _refresh_locks.setdefault(email_account.pk, threading.Lock())
+
+    with lock:
+        _reload_tokens(email_account)
+        if not _needs_refresh(email_account):
+            return OAuthResult(success=True, message='Token already refreshed')
+
+        lock_key = f'oauth:refresh:{email_account.pk}'
+        deadline = time.monotonic() + REFRESH_LOCK_TIMEOUT
+        while not cache.add(lock_key, 1, REFRESH_LOCK_TIMEOUT):
+            if time.monotonic() >= deadline:
+                # The holder died without releasing; refresh ourselves
+                break
+            time.sleep(0.2)
+            _reload_tokens(email_account)
+            if not _needs_refresh(email_account):
+                return OAuthResult(success=True, message='Token already refreshed')
+
+        try:
+            return refresh(email_account)
+        finally:
+            cache.delete(lock_key)
+
+
 class GoogleOAuthService:
     """Service for Google OAuth operations."""
 
-    SCOPES = [
+    SCOPES = (
+        'openid',
         'https://www.googleapis.com/auth/gmail.send',
         'https://www.googleapis.com/auth/gmail.readonly',
         'https://www.googleapis.com/auth/userinfo.email',
         'https://www.googleapis.com/auth/userinfo.profile',
-    ]
+    )
 
     def __init__(self):
         self.client_id = os.environ.get('GOOGLE_CLIENT_ID', '')
@@ -44,22 +136,25 @@ class GoogleOAuthService:
             'GOOGLE_REDIRECT_URI',
             'http://localhost:8000/api/v1/email-accounts/oauth/google/callback/'
         )
+        self._client_config = {
+            'web': {
+                'client_id': self.client_id,
+                'client_secret': self.client_secret,
+                'auth_uri': 'https://accounts.google.com/o/oauth2/auth',
+                'token_uri': 'https://oauth2.googleapis.com/token',
+                'redirect_uris': [self.redirect_uri],
+            }
+        }
+
+    def _flow(self) -> Flow:
+        """Build an OAuth flow from this service's client config."""
+        flow = Flow.from_client_config(self._client_config, scopes=self.SCOPES)
+        flow.redirect_uri = self.redirect_uri
+        return flow
 
     def get_authorization_url(self, state: str = None) -> Tuple[str, str]:
         """Get the Google OAuth authorization URL."""
-        flow = Flow.from_client_config(
-            {
-                'web': {
-                    'client_id': self.client_id,
-                    'client_secret': self.client_secret,
-                    'auth_uri': 'https://accounts.google.com/o/oauth2/auth',
-                    'token_uri': 'https://oauth2.googleapis.com/token',
-                    'redirect_uris': [self.redirect_uri],
-                }
-            },
-            scopes=self.SCOPES
-        )
-        flow.redirect_uri = self.redirect_uri
+        flow = self._flow()
 
         authorization_url, state = flow.authorization_url(
             access_type='offline',
@@ -73,26 +168,16 @@ class GoogleOAuthService:
     def exchange_code(self, code: str) -> OAuthResult:
         """Exchange authorization code for tokens."""
         try:
-            flow = Flow.from_client_config(
-                {
-                    'web': {
-                        'client_id': self.client_id,
-                        'client_secret': self.client_secret,
-                        'auth_uri': 'https://accounts.google.com/o/oauth2/auth',
-                        'token_uri': 'https://oauth2.googleapis.com/token',
-                        'redirect_uris': [self.redirect_uri],
-                    }
-                },
-                scopes=self.SCOPES
-            )
-            flow.redirect_uri = self.redirect_uri
+            flow = self._flow()
             flow.fetch_token(code=code)
 
             credentials = flow.credentials
 
-            # Get user info
-            service = build('oauth2', 'v2', credentials=credentials)
-            user_info = service.userinfo().get().execute()
+            # The ID token came straight from Google's token endpoint over
+            # TLS, so its claims can be read without fetching signing certs
+            user_info = jwt.decode(credentials.id_token, verify=False)
+            if user_info.get('aud') != self.client_id:
+                raise ValueError('ID token was not issued for this client')
 
             return OAuthResult(
                 success=True,
@@ -161,6 +246,29 @@ class GoogleOAuthService:
                 message=f'Failed to refresh token: {str(e)}'
             )
 
+    def _gmail_service(self, email_account: EmailAccount):
+        """This thread's Gmail API service for the account.
+
+        The service is rebuilt only when the access token changes.
+        """
+        services = _api_clients.__dict__.setdefault('gmail', {})
+        token = email_account.oauth_access_token
+
+        cached = services.get(email_account.pk)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+
+        credentials = Credentials(
+            token=token,
+            refresh_token=email_account.oauth_refresh_token,
+            token_uri='https://oauth2.googleapis.com/token',
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+        )
+        service = build('gmail', 'v1', credentials=credentials)
+        services[email_account.pk] = (token, service)
+        return service
+
     def send_email(
         self,
         email_account: EmailAccount,
@@ -170,57 +278,100 @@ class GoogleOAuthService:
         text_body: Optional[str] = None
     ) -> OAuthResult:
         """Send email using Gmail API."""
-        try:
-            # Check if token needs refresh
-            if email_account.oauth_token_expires_at:
-                if timezone.now() >= email_account.oauth_token_expires_at - timedelta(minutes=5):
-                    refresh_result = self.refresh_token(email_account)
-                    if not refresh_result.success:
-                        return refresh_result
-
-            credentials = Credentials(
-                token=email_account.oauth_access_token,
-                refresh_token=email_account.oauth_refresh_token,
-                token_uri='https://oauth2.googleapis.com/token',
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
+        return self.send_emails_bulk(email_account, [{
+            'to_email': to_email,
+            'subject': subject,
+            'html_body': html_body,
+            'text_body': text_body,
+        }])[0]
+
+    def send_emails_bulk(
+        self,
+        email_account: EmailAccount,
+        messages: List[dict]
+    ) -> List[OAuthResult]:
+        """Send several emails using Gmail API batch requests.
 
-            service = build('gmail', 'v1', credentials=credentials)
+        Each message is a dict of `send_email` keyword arguments. Up to
+        GMAIL_BATCH_SIZE sends share one HTTP request.
 
-            # Create message
-            message = MIMEMultipart('alternative')
-            message['to'] = to_email
-            message['from'] = f"{email_account.from_name} <{email_account.email}>" if email_account.from_name else email_account.email
-            message['subject'] = subject
+        Returns:
+            One OAuthResult per message, in order.
+        """
+        try:
+            # Check if token needs refresh
+            if _needs_refresh(email_account):
+                refresh_result = _refresh_once(email_account, self.refresh_token)
+                if not refresh_result.success:
+                    return [refresh_result] * len(messages)
 
-            if text_body:
-                message.attach(MIMEText(text_body, 'plain'))
-            message.attach(MIMEText(html_body, 'html'))
+            service = self._gmail_service(email_account)
+        except Exception as e:
+            return [OAuthResult(
+                success=False,
+                message=f'Failed to send email: {str(e)}'
+            )] * len(messages)
 
-            # Encode message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+        results = [None] * len(messages)
 
-            # Send
-            result = service.users().messages().send(
-                userId='me',
-                body={'raw': raw_message}
-            ).execute()
+        def collect(request_id, response, exception):
+            if exception is not None:
+                results[int(request_id)] = OAuthResult(
+                    success=False,
+                    message=f'Failed to send email: {str(exception)}'
+                )
+            else:
+                results[int(request_id)] = OAuthResult(
+                    success=True,
+                    message='Email sent successfully',
+                    data={'message_id': response.get('id')}
+                )
 
-            # Update counters
-            email_account.increment_sent_count()
+        for start in range(0, len(messages), GMAIL_BATCH_SIZE):
+            chunk = messages[start:start + GMAIL_BATCH_SIZE]
+            try:
+                batch = service.new_batch_http_request(callback=collect)
+                for index, message in enumerate(chunk, start):
+                    raw_message = self._raw_message(email_account, **message)
+                    batch.add(
+                        service.users().messages().send(userId='me', body={'raw': raw_message}),
+                        request_id=str(index)
+                    )
+                batch.execute()
+            except Exception as e:
+                for index in range(start, start + len(chunk)):
+                    if results[index] is None:
+                        results[index] = OAuthResult(
+                            success=False,
+                            message=f'Failed to send email: {str(e)}'
+                        )
+
+        # Update counters
+        sent = sum(1 for result in results if result.success)
+        if sent:
+            email_account.increment_sent_count(sent)
+
+        return results
+
+    @staticmethod
+    def _raw_message(
+        email_account: EmailAccount,
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None
+    ) -> str:
+        """Build a message as the base64url 'raw' value Gmail expects."""
+        message = MIMEMultipart('alternative')
+        message['to'] = to_email
+        message['from'] = f"{email_account.from_name} <{email_account.email}>" if email_account.from_name else email_account.email
+        message['subject'] = subject
 
-            return OAuthResult(
-                success=True,
-                message='Email sent successfully',
-                data={'message_id': result.get('id')}
-            )
+        if text_body:
+            message.attach(MIMEText(text_body, 'plain'))
+        message.attach(MIMEText(html_body, 'html'))
 
-        except Exception as e:
-            return OAuthResult(
-                success=False,
-                message=f'Failed to send email: {str(e)}'
-            )
+        return base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
 
 
 class MicrosoftOAuthService:
@@ -245,11 +396,7 @@ class MicrosoftOAuthService:
 
     def _get_msal_app(self) -> msal.ConfidentialClientApplication:
         """Get MSAL application instance."""
-        return msal.ConfidentialClientApplication(
-            self.client_id,
-            authority=self.authority,
-            client_credential=self.client_secret,
-        )
+        return _msal_app(self.client_id, self.authority, self.client_secret)
 
     def get_authorization_url(self, state: str = None) -> Tuple[str, str]:
         """Get the Microsoft OAuth authorization URL."""
@@ -281,9 +428,8 @@ class MicrosoftOAuthService:
                 )
 
             # Get user info
-            import requests
             headers = {'Authorization': f"Bearer {result['access_token']}"}
-            user_response = requests.get(
+            user_response = _graph_session().get(
                 'https://graph.microsoft.com/v1.0/me',
                 headers=headers
             )
@@ -373,59 +519,117 @@ class MicrosoftOAuthService:
         text_body: Optional[str] = None
     ) -> OAuthResult:
         """Send email using Microsoft Graph API."""
-        try:
-            import requests
-
-            # Check if token needs refresh
-            if email_account.oauth_token_expires_at:
-                if timezone.now() >= email_account.oauth_token_expires_at - timedelta(minutes=5):
-                    refresh_result = self.refresh_token(email_account)
-                    if not refresh_result.success:
-                        return refresh_result
-
-            headers = {
-                'Authorization': f'Bearer {email_account.oauth_access_token}',
-                'Content-Type': 'application/json',
-            }
-
-            # Create message
-            message = {
-                'message': {
-                    'subject': subject,
-                    'body': {
-                        'contentType': 'HTML',
-                        'content': html_body,
-                    },
-                    'toRecipients': [
-                        {'emailAddress': {'address': to_email}}
-                    ],
-                },
-                'saveToSentItems': True,
-            }
-
-            response = requests.post(
-                'https://graph.microsoft.com/v1.0/me/sendMail',
-                headers=headers,
-                json=message
-            )
-
-            if response.status_code == 202:
-                # Update counters
-                email_account.increment_sent_count()
+        return self.send_emails_bulk(email_account, [{
+            'to_email': to_email,
+            'subject': subject,
+            'html_body': html_body,
+            'text_body': text_body,
+        }])[0]
+
+    def send_emails_bulk(
+        self,
+        email_account: EmailAccount,
+        messages: List[dict]
+    ) -> List[OAuthResult]:
+        """Send several emails using Microsoft Graph JSON batching.
 
-                return OAuthResult(
-                    success=True,
-                    message='Email sent successfully'
-                )
-            else:
-                error = response.json()
-                return OAuthResult(
-                    success=False,
-                    message=f"Failed to send email: {error.get('error', {}).get('message', 'Unknown error')}"
-                )
+        Each message is a dict of `send_email` keyword arguments. Up to
+        GRAPH_BATCH_SIZE sends share one $batch request.
 
+        Returns:
+            One OAuthResult per message, in order.
+        """
+        # Check if token needs refresh
+        try:
+            if _needs_refresh(email_account):
+                refresh_result = _refresh_once(email_account, self.refresh_token)
+                if not refresh_result.success:
+                    return [refresh_result] * len(messages)
         except Exception as e:
-            return OAuthResult(
+            return [OAuthResult(
                 success=False,
                 message=f'Failed to send email: {str(e)}'
-            )
+            )] * len(messages)
+
+        headers = {
+            'Authorization': f'Bearer {email_account.oauth_access_token}',
+            'Content-Type': 'application/json',
+        }
+        results = [None] * len(messages)
+
+        for start in range(0, len(messages), GRAPH_BATCH_SIZE):
+            chunk = messages[start:start + GRAPH_BATCH_SIZE]
+            try:
+                response = _graph_session().post(
+                    'https://graph.microsoft.com/v1.0/$batch',
+                    headers=headers,
+                    json={
+                        'requests': [
+                            {
+                                'id': str(index),
+                                'method': 'POST',
+                                'url': '/me/sendMail',
+                                'headers': {'Content-Type': 'application/json'},
+                                'body': self._graph_message(**message),
+                            }
+                            for index, message in enumerate(chunk, start)
+                        ]
+                    }
+                )
+                if response.status_code != 200:
+                    error = response.json()
+                    raise ValueError(error.get('error', {}).get('message', 'Unknown error'))
+
+                for item in response.json().get('responses', []):
+                    if item.get('status') == 202:
+                        result = OAuthResult(
+                            success=True,
+                            message='Email sent successfully'
+                        )
+                    else:
+                        error = (item.get('body') or {}).get('error', {})
+                        result = OAuthResult(
+                            success=False,
+                            message=f"Failed to send email: {error.get('message', 'Unknown error')}"
+                        )
+                    results[int(item['id'])] = result
+
+                if any(results[index] is None for index in range(start, start + len(chunk))):
+                    raise ValueError('No response for every message in the batch')
+
+            except Exception as e:
+                for index in range(start, start + len(chunk)):
+                    if results[index] is None:
+                        results[index] = OAuthResult(
+                            success=False,
+                            message=f'Failed to send email: {str(e)}'
+                        )
+
+        # Update counters
+        sent = sum(1 for result in results if result.success)
+        if sent:
+            email_account.increment_sent_count(sent)
+
+        return results
+
+    @staticmethod
+    def _graph_message(
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None
+    ) -> dict:
+        """Build a sendMail request body."""
+        return {
+            'message': {
+                'subject': subject,
+                'body': {
+                    'contentType': 'HTML',
+                    'content': html_body,
+                },
+                'toRecipients': [
+                    {'emailAddress': {'address': to_email}}
+                ],
+            },
+            'saveToSentItems': True,
+        }
@@ -0,0 +1,104 @@
+import logging
+import smtplib
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, acks_late=True, max_retries=3)
+def send_email_batch(self, account_id: str, messages: list):
+    """Send a batch of emails from one account over a single SMTP session.
+
+    Each message is a dict of `EmailService.send_email` keyword arguments.
+    The task is retried if the SMTP server cannot be reached at all;
+    per-message failures are logged and reported in the result instead.
+    """
+    from .models import EmailAccount
+    from .services import EmailService
+
+    try:
+        account = EmailAccount.objects.get(id=account_id)
+    except EmailAccount.DoesNotExist:
+        return {'error': 'Email account not found'}
+
+    service = EmailService(account)
+
+    if account.can_send:
+        try:
+            service.ensure_connected()
+        except (smtplib.SMTPException, OSError) as e:
+            logger.warning(f"SMTP connection failed for account {account_id}: {e}")
+            raise self.retry(exc=e, countdown=60)
+
+    results = service.send_batch(messages)
+
+    return {
+        'sent_count': sum(1 for result in results if result.success),
+        'failed_count': sum(1 for result in results if not result.success),
+        'results': [
+            {
+                'to': message['to_email'],
+                'success': result.success,
+                'message': result.message,
+                'message_id': result.message_id,
+            }
+            for message, result in zip(messages, results)
+        ],
+    }
+
+
+@shared_task
+def send_email_task(account_id: str, to_email: str, subject: str, html_body: str, text_body: str = None):
+    """Send one email through the account's provider (Gmail, Outlook or SMTP)."""
+    from .models import EmailAccount
+    from .services import EmailService, GoogleOAuthService, MicrosoftOAuthService
+
+    try:
+        account = EmailAccount.objects.get(id=account_id)
+    except EmailAccount.DoesNotExist:
+        return {'account_id': account_id, 'success': False, 'message': 'Email account not found'}
+
+    oauth_service = {
+        EmailAccount.Provider.GMAIL: GoogleOAuthService,
+        EmailAccount.Provider.OUTLOOK: MicrosoftOAuthService,
+    }.get(account.provider)
+
+    if oauth_service:
+        result = oauth_service().send_email(
+            account, to_email=to_email, subject=subject,
+            html_body=html_body, text_body=text_body
+        )
+        message_id = (result.data or {}).get('message_id')
+    else:
+        result = EmailService(account).send_email(
+            to_email=to_email, subject=subject,
+            html_body=html_body, text_body=text_body
+        )
+        message_id = result.message_id
+
+    return {
+        'account_id': account_id,
+        'success': result.success,
+        'message': result.message,
+        'message_id': message_id,
+    }
+
+
+@shared_task
+def reset_hourly_email_counters():
+    """Reset every account's hourly sent counter. Runs at the top of each hour."""
+    from .models import EmailAccount
+
+    return {'accounts': EmailAccount.reset_all_hourly()}
+
+
+@shared_task
+def reset_daily_email_counters():
+    """Reset every account's daily sent counter and advance warmup limits.
+
+    Runs at midnight UTC.
+    """
+    from .models import EmailAccount
+
+    return {'accounts': EmailAccount.reset_all_daily()}
@@ -1,5 +1,9 @@
+import html
 import uuid
 
+from celery.result import AsyncResult
+from django.core import signing
+from django.core.cache import cache
 from django.shortcuts import redirect
 from django.utils import timezone
 from rest_framework import viewsets, status
@@ -9,7 +13,7 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
 
-from .models import EmailAccount, EmailAccountLog
+from .models import CREDENTIAL_FIELDS, EmailAccount, EmailAccountLog
 from .serializers import (
     EmailAccountSerializer,
     EmailAccountCreateSerializer,
@@ -19,6 +23,12 @@ from .serializers import (
     SendTestEmailSerializer,
 )
 from .services import EmailService, GoogleOAuthService, MicrosoftOAuthService
+from .tasks import send_email_task
+
+
+# OAuth state is signed so callbacks cannot be forged for another user
+OAUTH_STATE_SALT = 'email_accounts.oauth_state'
+OAUTH_STATE_MAX_AGE = 10 * 60
 
 
 class EmailAccountViewSet(viewsets.ModelViewSet):
@@ -30,7 +40,11 @@ class EmailAccountViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return email accounts for the current user."""
-        return EmailAccount.objects.filter(user=self.request.user)
+        queryset = EmailAccount.objects.filter(user=self.request.user)
+        if self.action in ['list', 'retrieve']:
+            # Credentials are never serialized; skip reading and decrypting them
+            queryset = queryset.defer(*CREDENTIAL_FIELDS)
+        return queryset
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -52,21 +66,16 @@ class EmailAccountViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
 
         service = EmailService(account)
-        results = {}
-
-        if serializer.validated_data.get('test_smtp', True):
-            smtp_result = service.test_smtp_connection()
-            results['smtp'] = {
-                'success': smtp_result.success,
-                'message': smtp_result.message
-            }
-
-        if serializer.validated_data.get('test_imap', False):
-            imap_result = service.test_imap_connection()
-            results['imap'] = {
-                'success': imap_result.success,
-                'message': imap_result.message
+        results = {
+            name: {
+                'success': result.success,
+                'message': result.message
             }
+            for name, result in service.test_connections(
+                smtp=serializer.validated_data.get('test_smtp', True),
+                imap=serializer.validated_data.get('test_imap', False),
+            ).items()
+        }
 
         overall_success = all(r.get('success', False) for r in results.values())
 
@@ -77,50 +86,53 @@ class EmailAccountViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['post'])
     def send_test_email(self, request, pk=None):
-        """Send a test email."""
+        """Queue a test email; poll send_test_email/{task_id}/ for the outcome."""
         account = self.get_object()
         serializer = SendTestEmailSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        # Use appropriate service based on provider
-        if account.provider == EmailAccount.Provider.GMAIL:
-            service = GoogleOAuthService()
-            result = service.send_email(
-                account,
-                to_email=serializer.validated_data['to_email'],
-                subject=serializer.validated_data['subject'],
-                html_body=f"<p>{serializer.validated_data['body']}</p>",
-                text_body=serializer.validated_data['body']
-            )
-        elif account.provider == EmailAccount.Provider.OUTLOOK:
-            service = MicrosoftOAuthService()
-            result = service.send_email(
-                account,
-                to_email=serializer.validated_data['to_email'],
-                subject=serializer.validated_data['subject'],
-                html_body=f"<p>{serializer.validated_data['body']}</p>",
-                text_body=serializer.validated_data['body']
-            )
-        else:
-            service = EmailService(account)
-            result = service.send_email(
-                to_email=serializer.validated_data['to_email'],
-                subject=serializer.validated_data['subject'],
-                html_body=f"<p>{serializer.validated_data['body']}</p>",
-                text_body=serializer.validated_data['body']
+        body = serializer.validated_data['body']
+        task = send_email_task.delay(
+            str(account.id),
+            to_email=serializer.validated_data['to_email'],
+            subject=serializer.validated_data['subject'],
+            html_body=f"<p>{html.escape(body)}</p>",
+            text_body=body
+        )
+
+        return Response({
+            'success': True,
+            'message': 'Test email queued',
+            'task_id': task.id
+        }, status=status.HTTP_202_ACCEPTED)
+
+    @action(
+        detail=True,
+        methods=['get'],
+        url_path=r'send_test_email/(?P<task_id>[0-9a-f-]+)'
+    )
+    def send_test_email_status(self, request, pk=None, task_id=None):
+        """Get the outcome of a queued test email."""
+        account = self.get_object()
+        task = AsyncResult(task_id)
+
+        if not task.ready():
+            return Response({'status': 'pending'})
+
+        result = task.result if task.successful() else None
+        # Only report results of this account's sends
+        if not isinstance(result, dict) or result.get('account_id') != str(account.id):
+            return Response(
+                {'error': 'Test email not found'},
+                status=status.HTTP_404_NOT_FOUND
             )
 
-        if result.success:
-            return Response({
-                'success': True,
-                'message': result.message,
-                'message_id': getattr(result, 'message_id', None) or result.data.get('message_id') if result.data else None
-            })
-        else:
-            return Response({
-                'success': False,
-                'message': result.message
-            }, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            'status': 'sent' if result['success'] else 'failed',
+            'success': result['success'],
+            'message': result['message'],
+            'message_id': result['message_id'],
+        })
 
     @action(detail=True, methods=['post'])
     def pause(self, request, pk=None):
@@ -172,7 +184,7 @@ class EmailAccountViewSet(viewsets.ModelViewSet):
     def logs(self, request, pk=None):
         """Get logs for an email account."""
         account = self.get_object()
-        logs = account.logs.all()[:100]
+        logs = account.logs.only(*EmailAccountLogSerializer.Meta.fields)[:100]
         serializer = EmailAccountLogSerializer(logs, many=True)
         return Response(serializer.data)
 
@@ -195,16 +207,66 @@ class EmailAccountViewSet(viewsets.ModelViewSet):
         })
 
 
+def make_oauth_state(user_id) -> str:
+    """Build the signed OAuth state identifying the user who started the flow."""
+    return signing.dumps(
+        {'user_id': str(user_id), 'nonce': uuid.uuid4().hex},
+        salt=OAUTH_STATE_SALT
+    )
+
+
+def parse_oauth_state(state: str):
+    """Return the user id from a signed OAuth state, or None if invalid or expired.
+
+    Each state is accepted once; its nonce is recorded in the cache until
+    the state would have expired anyway.
+    """
+    try:
+        payload = signing.loads(
+            state or '',
+            salt=OAUTH_STATE_SALT,
+            max_age=OAUTH_STATE_MAX_AGE
+        )
+        user_id, nonce = payload['user_id'], payload['nonce']
+    except (signing.BadSignature, KeyError, TypeError):
+        return None
+
+    if not cache.add(f'oauth_state:{nonce}', True, OAUTH_STATE_MAX_AGE):
+        return None
+    return user_id
+
+
+def save_oauth_account(user_id, provider: str, data: dict):
+    """Create or update the user's account for a completed OAuth flow.
+
+    Reconnecting an existing account is a single UPDATE; only new
+    accounts are inserted.
+    """
+    values = {
+        'name': data.get('name') or data['email'],
+        'provider': provider,
+        'oauth_access_token': data['access_token'],
+        'oauth_refresh_token': data['refresh_token'],
+        'oauth_token_expires_at': data.get('token_expires_at'),
+        'from_name': data.get('name', ''),
+        'status': EmailAccount.Status.ACTIVE,
+    }
+    updated = EmailAccount.objects.filter(
+        user_id=user_id,
+        email=data['email']
+    ).update(updated_at=timezone.now(), **values)
+
+    if not updated:
+        EmailAccount.objects.create(user_id=user_id, email=data['email'], **values)
+
+
 class GoogleOAuthInitView(APIView):
     """Initiate Google OAuth flow."""
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         service = GoogleOAuthService()
-        state = f"{request.user.id}:{uuid.uuid4()}"
-
-        # Store state in session
-        request.session['oauth_state'] = state
+        state = make_oauth_state(request.user.id)
 
         auth_url, _ = service.get_authorization_url(state=state)
         return Response({'authorization_url': auth_url})
@@ -225,10 +287,9 @@ class GoogleOAuthCallbackView(APIView):
         if not code:
             return redirect(f"{self._get_frontend_url()}/email-accounts?error=no_code")
 
-        # Extract user_id from state
-        try:
-            user_id = state.split(':')[0]
-        except:
+        # Extract user_id from the signed state
+        user_id = parse_oauth_state(state)
+        if user_id is None:
             return redirect(f"{self._get_frontend_url()}/email-accounts?error=invalid_state")
 
         service = GoogleOAuthService()
@@ -239,24 +300,10 @@ class GoogleOAuthCallbackView(APIView):
 
         # Create or update email account
         from apps.users.models import User
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
+        if not User.objects.filter(id=user_id).exists():
             return redirect(f"{self._get_frontend_url()}/email-accounts?error=user_not_found")
 
-        email_account, created = EmailAccount.objects.update_or_create(
-            user=user,
-            email=result.data['email'],
-            defaults={
-                'name': result.data.get('name') or result.data['email'],
-                'provider': EmailAccount.Provider.GMAIL,
-                'oauth_access_token': result.data['access_token'],
-                'oauth_refresh_token': result.data['refresh_token'],
-                'oauth_token_expires_at': result.data.get('token_expires_at'),
-                'from_name': result.data.get('name', ''),
-                'status': EmailAccount.Status.ACTIVE,
-            }
-        )
+        save_oauth_account(user_id, EmailAccount.Provider.GMAIL, result.data)
 
         return redirect(f"{self._get_frontend_url()}/email-accounts?success=true&email={result.data['email']}")
 
@@ -271,9 +318,7 @@ class MicrosoftOAuthInitView(APIView):
 
     def get(self, request):
         service = MicrosoftOAuthService()
-        state = f"{request.user.id}:{uuid.uuid4()}"
-
-        request.session['oauth_state'] = state
+        state = make_oauth_state(request.user.id)
 
         auth_url, _ = service.get_authorization_url(state=state)
         return Response({'authorization_url': auth_url})
@@ -295,9 +340,9 @@ class MicrosoftOAuthCallbackView(APIView):
         if not code:
             return redirect(f"{self._get_frontend_url()}/email-accounts?error=no_code")
 
-        try:
-            user_id = state.split(':')[0]
-        except:
+        # Extract user_id from the signed state
+        user_id = parse_oauth_state(state)
+        if user_id is None:
             return redirect(f"{self._get_frontend_url()}/email-accounts?error=invalid_state")
 
         service = MicrosoftOAuthService()
@@ -307,24 +352,10 @@ class MicrosoftOAuthCallbackView(APIView):
             return redirect(f"{self._get_frontend_url()}/email-accounts?error={result.message}")
 
         from apps.users.models import User
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
+        if not User.objects.filter(id=user_id).exists():
             return redirect(f"{self._get_frontend_url()}/email-accounts?error=user_not_found")
 
-        email_account, created = EmailAccount.objects.update_or_create(
-            user=user,
-            email=result.data['email'],
-            defaults={
-                'name': result.data.get('name') or result.data['email'],
-                'provider': EmailAccount.Provider.OUTLOOK,
-                'oauth_access_token': result.data['access_token'],
-                'oauth_refresh_token': result.data['refresh_token'],
-                'oauth_token_expires_at': result.data.get('token_expires_at'),
-                'from_name': result.data.get('name', ''),
-                'status': EmailAccount.Status.ACTIVE,
-            }
-        )
+        save_oauth_account(user_id, EmailAccount.Provider.OUTLOOK, result.data)
 
         return redirect(f"{self._get_frontend_url()}/email-accounts?success=true&email={result.data['email']}")
 
@@ -0,0 +1,36 @@
+import apps.core.fields
+from django.db import migrations
+
+ENCRYPTED_FIELDS = ['access_token', 'refresh_token']
+
+
+def encrypt_existing_tokens(apps, schema_editor):
+    """Rewrite stored tokens so plaintext values are encrypted."""
+    Integration = apps.get_model('integrations', 'Integration')
+
+    integrations = Integration.objects.only('pk', *ENCRYPTED_FIELDS)
+    for integration in integrations.iterator(chunk_size=500):
+        Integration.objects.filter(pk=integration.pk).update(**{
+            field: getattr(integration, field) for field in ENCRYPTED_FIELDS
+        })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='integration',
+            name='access_token',
+            field=apps.core.fields.EncryptedTextField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name='integration',
+            name='refresh_token',
+            field=apps.core.fields.EncryptedTextField(blank=True),
+        ),
+        migrations.RunPython(encrypt_existing_tokens, migrations.RunPython.noop),
+    ]
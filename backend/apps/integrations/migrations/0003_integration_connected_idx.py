@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0002_encrypt_tokens'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='integration',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'connected')), fields=['workspace', 'integration_type'], name='integration_connected_idx'),
+        ),
+    ]
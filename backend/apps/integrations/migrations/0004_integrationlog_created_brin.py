@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+# Integration logs are append-only, so created_at follows the physical row
+# order and a BRIN index prunes time-range scans (log cleanup) at a tiny
+# fraction of a btree's size.
+def create_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS integration_log_created_brin '
+        'ON integration_logs USING brin (created_at) WITH (pages_per_range = 32)'
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS integration_log_created_brin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0003_integration_connected_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
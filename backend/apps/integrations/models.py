@@ -1,11 +1,51 @@
 """Models for integrations system."""
 import secrets
 from django.db import models
+from django.db.models import Case, F, FloatField, Value, When
+from django.db.models.functions import Round
 from django.utils import timezone
 
+from apps.core.fields import EncryptedTextField
 from apps.core.models import BaseModel
 
 
+# OAuth token fields, only needed by the provider services
+TOKEN_FIELDS = ('access_token', 'refresh_token')
+
+
+class IntegrationQuerySet(models.QuerySet):
+    """QuerySet for integrations."""
+
+    def with_configs(self):
+        """Join the provider-specific configs so reading them costs no query."""
+        return self.select_related(
+            'created_by',
+            'slack_config',
+            'discord_config',
+            'hubspot_config',
+            'salesforce_config',
+            'google_sheets_config',
+        )
+
+    def for_listing(self):
+        """Skip the token columns, which API responses never include."""
+        return self.defer(*TOKEN_FIELDS)
+
+    def with_success_rate(self):
+        """Annotate `success_rate` as `success_rate_pct`, so it can be ordered by."""
+        return self.annotate(
+            success_rate_pct=Case(
+                When(total_syncs=0, then=Value(100.0)),
+                default=Round(
+                    F('successful_syncs') * 100.0 / F('total_syncs'),
+                    2,
+                    output_field=FloatField()
+                ),
+                output_field=FloatField(),
+            )
+        )
+
+
 class Integration(BaseModel):
     """Base model for all integrations."""
 
@@ -55,9 +95,9 @@ class Integration(BaseModel):
     # Configuration (stored as JSON)
     config = models.JSONField(default=dict)
 
-    # OAuth tokens (encrypted in production)
-    access_token = models.TextField(blank=True)
-    refresh_token = models.TextField(blank=True)
+    # OAuth tokens
+    access_token = EncryptedTextField(blank=True)
+    refresh_token = EncryptedTextField(blank=True)
     token_expires_at = models.DateTimeField(null=True, blank=True)
 
     # Usage tracking
@@ -68,35 +108,60 @@ class Integration(BaseModel):
     successful_syncs = models.IntegerField(default=0)
     failed_syncs = models.IntegerField(default=0)
 
+    objects = IntegrationQuerySet.as_manager()
+
     class Meta:
         db_table = 'integrations'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['workspace', 'integration_type']),
             models.Index(fields=['workspace', 'is_active']),
+            # Partial index for the notification services' active-integration lookup
+            models.Index(
+                fields=['workspace', 'integration_type'],
+                condition=models.Q(is_active=True, status='connected'),
+                name='integration_connected_idx',
+            ),
         ]
 
     def __str__(self):
         return f"{self.name} ({self.get_integration_type_display()})"
 
     def record_sync(self, success, error_message=''):
-        """Record a sync attempt."""
+        """Record a sync attempt.
+
+        Counters are incremented in SQL so concurrent syncs don't lose
+        updates, and only the sync columns are written.
+        """
         now = timezone.now()
-        self.last_sync_at = now
-        self.total_syncs += 1
+        values = {
+            'last_sync_at': now,
+            'total_syncs': F('total_syncs') + 1,
+            'updated_at': now,
+        }
 
         if success:
-            self.successful_syncs += 1
-            self.last_error = ''
-            self.status = self.Status.CONNECTED
+            values.update(
+                successful_syncs=F('successful_syncs') + 1,
+                last_error='',
+                status=self.Status.CONNECTED,
+            )
         else:
-            self.failed_syncs += 1
-            self.last_error = error_message[:1000]
-            self.last_error_at = now
-            if self.failed_syncs >= 5:
-                self.status = self.Status.ERROR
-
-        self.save()
+            values.update(
+                failed_syncs=F('failed_syncs') + 1,
+                last_error=error_message[:1000],
+                last_error_at=now,
+                # Compared against the pre-increment count
+                status=Case(
+                    When(failed_syncs__gte=4, then=Value(self.Status.ERROR)),
+                    default=F('status'),
+                ),
+            )
+
+        type(self).objects.filter(pk=self.pk).update(**values)
+        # Keep this instance current so a later save() doesn't write back
+        # stale counters
+        self.refresh_from_db(fields=list(values))
 
     @property
     def success_rate(self):
@@ -11,7 +11,7 @@ class IntegrationSerializer(serializers.ModelSerializer):
     """Serializer for Integration model."""
 
     created_by_email = serializers.CharField(source='created_by.email', read_only=True)
-    success_rate = serializers.ReadOnlyField()
+    success_rate = serializers.SerializerMethodField()
     integration_type_display = serializers.CharField(
         source='get_integration_type_display', read_only=True
     )
@@ -46,6 +46,10 @@ class IntegrationSerializer(serializers.ModelSerializer):
             'created_by_email', 'created_at', 'updated_at',
         ]
 
+    def get_success_rate(self, obj):
+        # Annotated by IntegrationQuerySet.with_success_rate()
+        return getattr(obj, 'success_rate_pct', obj.success_rate)
+
 
 class IntegrationCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating an integration."""
@@ -244,60 +248,63 @@ class IntegrationTypeSerializer(serializers.Serializer):
     requires_oauth = serializers.BooleanField()
     icon = serializers.CharField()
 
-    @staticmethod
-    def get_integration_types():
+    # Constant, so built once rather than per request
+    INTEGRATION_TYPES = (
+        {
+            'value': 'slack',
+            'label': 'Slack',
+            'description': 'Send notifications to Slack channels',
+            'requires_oauth': True,
+            'icon': 'slack',
+        },
+        {
+            'value': 'discord',
+            'label': 'Discord',
+            'description': 'Send notifications via Discord webhooks',
+            'requires_oauth': False,
+            'icon': 'discord',
+        },
+        {
+            'value': 'hubspot',
+            'label': 'HubSpot',
+            'description': 'Sync contacts with HubSpot CRM',
+            'requires_oauth': True,
+            'icon': 'hubspot',
+        },
+        {
+            'value': 'salesforce',
+            'label': 'Salesforce',
+            'description': 'Sync contacts with Salesforce CRM',
+            'requires_oauth': True,
+            'icon': 'salesforce',
+        },
+        {
+            'value': 'google_sheets',
+            'label': 'Google Sheets',
+            'description': 'Export data to Google Sheets',
+            'requires_oauth': True,
+            'icon': 'google-sheets',
+        },
+        {
+            'value': 'zapier',
+            'label': 'Zapier',
+            'description': 'Connect with 5000+ apps via Zapier',
+            'requires_oauth': False,
+            'icon': 'zapier',
+        },
+        {
+            'value': 'n8n',
+            'label': 'n8n',
+            'description': 'Connect with n8n automation workflows',
+            'requires_oauth': False,
+            'icon': 'n8n',
+        },
+    )
+
+    @classmethod
+    def get_integration_types(cls):
         """Get all available integration types."""
-        return [
-            {
-                'value': 'slack',
-                'label': 'Slack',
-                'description': 'Send notifications to Slack channels',
-                'requires_oauth': True,
-                'icon': 'slack',
-            },
-            {
-                'value': 'discord',
-                'label': 'Discord',
-                'description': 'Send notifications via Discord webhooks',
-                'requires_oauth': False,
-                'icon': 'discord',
-            },
-            {
-                'value': 'hubspot',
-                'label': 'HubSpot',
-                'description': 'Sync contacts with HubSpot CRM',
-                'requires_oauth': True,
-                'icon': 'hubspot',
-            },
-            {
-                'value': 'salesforce',
-                'label': 'Salesforce',
-                'description': 'Sync contacts with Salesforce CRM',
-                'requires_oauth': True,
-                'icon': 'salesforce',
-            },
-            {
-                'value': 'google_sheets',
-                'label': 'Google Sheets',
-                'description': 'Export data to Google Sheets',
-                'requires_oauth': True,
-                'icon': 'google-sheets',
-            },
-            {
-                'value': 'zapier',
-                'label': 'Zapier',
-                'description': 'Connect with 5000+ apps via Zapier',
-                'requires_oauth': False,
-                'icon': 'zapier',
-            },
-            {
-                'value': 'n8n',
-                'label': 'n8n',
-                'description': 'Connect with n8n automation workflows',
-                'requires_oauth': False,
-                'icon': 'n8n',
-            },
-        ]
+        return cls.INTEGRATION_TYPES
 
 
 class OAuthURLSerializer(serializers.Serializer):
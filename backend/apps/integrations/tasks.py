@@ -0,0 +1,18 @@
+from celery import shared_task
+from django.utils import timezone
+
+
+@shared_task
+def cleanup_old_integration_logs(days: int = 90):
+    """Delete integration logs older than `days` days."""
+    from .models import IntegrationLog
+
+    cutoff_date = timezone.now() - timezone.timedelta(days=days)
+
+    deleted_count, _ = IntegrationLog.objects.filter(
+        created_at__lt=cutoff_date
+    ).delete()
+
+    return {
+        'deleted_count': deleted_count
+    }
@@ -52,7 +52,7 @@ class IntegrationViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
     queryset = Integration.objects.all()
     filterset_class = IntegrationFilter
     search_fields = ['name', 'description']
-    ordering_fields = ['name', 'created_at', 'last_sync_at']
+    ordering_fields = ['name', 'created_at', 'last_sync_at', 'success_rate_pct']
     ordering = ['-created_at']
 
     def get_serializer_class(self):
@@ -62,7 +62,10 @@ class IntegrationViewSet(WorkspaceViewSetMixin, viewsets.ModelViewSet):
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        return queryset.select_related('created_by')
+        if self.action in ('test', 'sync', 'settings'):
+            # These read the provider config of the integration
+            return queryset.with_configs()
+        return queryset.select_related('created_by').for_listing().with_success_rate()
 
     @action(detail=False, methods=['get'])
     def types(self, request):
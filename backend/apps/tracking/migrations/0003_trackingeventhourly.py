@@ -0,0 +1,35 @@
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0002_campaign_abtestvariant_campaignlog_campaignrecipient_and_more'),
+        ('tracking', '0002_website_tracking'),
+        ('workspaces', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrackingEventHourly',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('hour', models.DateTimeField()),
+                ('opens', models.IntegerField(default=0)),
+                ('clicks', models.IntegerField(default=0)),
+                ('unsubscribes', models.IntegerField(default=0)),
+                ('bounces', models.IntegerField(default=0)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tracking_event_rollups', to='campaigns.campaign')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tracking_event_rollups', to='workspaces.workspace')),
+            ],
+            options={
+                'db_table': 'tracking_event_hourly',
+                'indexes': [models.Index(fields=['workspace', 'hour'], name='tracking_ev_workspa_f3e082_idx')],
+                'unique_together': {('campaign', 'hour')},
+            },
+        ),
+    ]
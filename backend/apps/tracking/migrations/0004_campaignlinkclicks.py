@@ -0,0 +1,57 @@
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def backfill_link_clicks(apps, schema_editor):
+    """Seed the per-campaign totals from existing tracking links."""
+    TrackingLink = apps.get_model('tracking', 'TrackingLink')
+    CampaignLinkClicks = apps.get_model('tracking', 'CampaignLinkClicks')
+
+    totals = TrackingLink.objects.filter(
+        click_count__gt=0
+    ).values(
+        'campaign_recipient__campaign_id', 'original_url'
+    ).annotate(
+        total=models.Sum('click_count')
+    ).order_by()
+
+    batch = []
+    for row in totals.iterator(chunk_size=2000):
+        batch.append(CampaignLinkClicks(
+            campaign_id=row['campaign_recipient__campaign_id'],
+            original_url=row['original_url'],
+            total_clicks=row['total'],
+        ))
+        if len(batch) >= 1000:
+            CampaignLinkClicks.objects.bulk_create(batch)
+            batch = []
+    CampaignLinkClicks.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0003_campaign_active_idx'),
+        ('tracking', '0003_trackingeventhourly'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignLinkClicks',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('original_url', models.URLField(max_length=2048)),
+                ('total_clicks', models.IntegerField(default=0)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='link_clicks', to='campaigns.campaign')),
+            ],
+            options={
+                'db_table': 'campaign_link_clicks',
+                'indexes': [models.Index(fields=['campaign', '-total_clicks'], name='campaign_li_campaig_11ec01_idx')],
+                'unique_together': {('campaign', 'original_url')},
+            },
+        ),
+        migrations.RunPython(backfill_link_clicks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+from django.db import migrations, models
+from django.db.models.functions import TruncHour
+
+
+def backfill_tracking_event_hourly(apps, schema_editor):
+    """Roll up existing tracking events, so reports keep their history.
+
+    Mirrors `rollup_tracking_events` over all time; rows the task already
+    wrote are recomputed in place.
+    """
+    TrackingEvent = apps.get_model('tracking', 'TrackingEvent')
+    TrackingEventHourly = apps.get_model('tracking', 'TrackingEventHourly')
+
+    rows = TrackingEvent.objects.filter(
+        is_bot=False
+    ).annotate(
+        hour=TruncHour('created_at')
+    ).values(
+        'hour',
+        'campaign_recipient__campaign_id',
+        'campaign_recipient__campaign__workspace_id',
+    ).annotate(
+        opens=models.Count('id', filter=models.Q(event_type='open')),
+        clicks=models.Count('id', filter=models.Q(event_type='click')),
+        unsubscribes=models.Count('id', filter=models.Q(event_type='unsubscribe')),
+        bounces=models.Count('id', filter=models.Q(event_type='bounce')),
+    ).order_by()
+
+    def write(batch):
+        TrackingEventHourly.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=['campaign', 'hour'],
+            update_fields=['opens', 'clicks', 'unsubscribes', 'bounces'],
+        )
+
+    batch = []
+    for row in rows.iterator(chunk_size=2000):
+        batch.append(TrackingEventHourly(
+            workspace_id=row['campaign_recipient__campaign__workspace_id'],
+            campaign_id=row['campaign_recipient__campaign_id'],
+            hour=row['hour'],
+            opens=row['opens'],
+            clicks=row['clicks'],
+            unsubscribes=row['unsubscribes'],
+            bounces=row['bounces'],
+        ))
+        if len(batch) >= 1000:
+            write(batch)
+            batch = []
+    write(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracking', '0004_campaignlinkclicks'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_tracking_event_hourly, migrations.RunPython.noop),
+    ]
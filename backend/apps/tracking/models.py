@@ -57,6 +57,32 @@ class TrackingLink(BaseModel):
         return f"{self.token[:8]}... -> {self.original_url[:50]}"
 
 
+class CampaignLinkClicks(BaseModel):
+    """Running click total per campaign and destination URL.
+
+    Incremented alongside TrackingLink.click_count so campaign reports can
+    read top links without summing every recipient's tracking links.
+    """
+
+    campaign = models.ForeignKey(
+        'campaigns.Campaign',
+        on_delete=models.CASCADE,
+        related_name='link_clicks'
+    )
+    original_url = models.URLField(max_length=2048)
+    total_clicks = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'campaign_link_clicks'
+        unique_together = ['campaign', 'original_url']
+        indexes = [
+            models.Index(fields=['campaign', '-total_clicks']),
+        ]
+
+    def __str__(self):
+        return f"{self.original_url[:50]}: {self.total_clicks}"
+
+
 class TrackingPixel(BaseModel):
     """Tracking pixel for open tracking."""
 
@@ -198,6 +224,41 @@ class TrackingEvent(BaseModel):
         return f"{self.event_type} - {self.campaign_recipient}"
 
 
+class TrackingEventHourly(BaseModel):
+    """Hourly rollup of human tracking events per campaign.
+
+    Maintained by the rollup_tracking_events task so time-series reports
+    read one row per campaign-hour instead of scanning TrackingEvent.
+    """
+
+    workspace = models.ForeignKey(
+        'workspaces.Workspace',
+        on_delete=models.CASCADE,
+        related_name='tracking_event_rollups'
+    )
+    campaign = models.ForeignKey(
+        'campaigns.Campaign',
+        on_delete=models.CASCADE,
+        related_name='tracking_event_rollups'
+    )
+    hour = models.DateTimeField()
+
+    opens = models.IntegerField(default=0)
+    clicks = models.IntegerField(default=0)
+    unsubscribes = models.IntegerField(default=0)
+    bounces = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'tracking_event_hourly'
+        unique_together = ['campaign', 'hour']
+        indexes = [
+            models.Index(fields=['workspace', 'hour']),
+        ]
+
+    def __str__(self):
+        return f"{self.campaign_id} @ {self.hour}"
+
+
 class BounceRecord(BaseModel):
     """Record of email bounces for deliverability tracking."""
 
@@ -5,8 +5,10 @@ from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
 from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
+from django.db.models import F
 
 from apps.tracking.models import (
+    CampaignLinkClicks,
     TrackingLink,
     TrackingPixel,
     TrackingEvent,
@@ -539,6 +541,9 @@ class TrackingService:
             link.first_clicked_at = now
         link.last_clicked_at = now
         link.save(update_fields=['click_count', 'first_clicked_at', 'last_clicked_at', 'updated_at'])
+        self._increment_campaign_link_clicks(
+            link.campaign_recipient.campaign_id, link.original_url
+        )
 
         # Get geo info
         geo_info = self.get_geo_info(ip_address)
@@ -572,6 +577,21 @@ class TrackingService:
         logger.info(f"Recorded click for link {link_token[:8]} (bot: {is_bot})")
         return event, link.original_url
 
+    @staticmethod
+    def _increment_campaign_link_clicks(campaign_id, original_url: str) -> None:
+        """Bump the campaign-wide click total for a destination URL."""
+        totals = CampaignLinkClicks.objects.filter(
+            campaign_id=campaign_id,
+            original_url=original_url
+        )
+        if not totals.update(total_clicks=F('total_clicks') + 1):
+            # First click on this URL; a concurrent first click may win the insert
+            CampaignLinkClicks.objects.bulk_create(
+                [CampaignLinkClicks(campaign_id=campaign_id, original_url=original_url)],
+                ignore_conflicts=True,
+            )
+            totals.update(total_clicks=F('total_clicks') + 1)
+
     @transaction.atomic
     def process_unsubscribe(
         self,
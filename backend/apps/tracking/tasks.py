@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from celery import shared_task
+from django.db.models import Count, Q
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+
+@shared_task
+def rollup_tracking_events(hours: int = 3):
+    """Recompute the hourly tracking event rollup for recent hours.
+
+    Meant to run every 15 minutes. Each run rewrites the counts for the
+    last `hours` hours, so late or repeated runs are harmless. Run once
+    with a large `hours` value to backfill existing events.
+    """
+    from .models import TrackingEvent, TrackingEventHourly
+
+    start = (timezone.localtime() - timedelta(hours=hours)).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+    rows = TrackingEvent.objects.filter(
+        created_at__gte=start,
+        is_bot=False
+    ).annotate(
+        hour=TruncHour('created_at')
+    ).values(
+        'hour',
+        'campaign_recipient__campaign_id',
+        'campaign_recipient__campaign__workspace_id',
+    ).annotate(
+        opens=Count('id', filter=Q(event_type=TrackingEvent.EventType.OPEN)),
+        clicks=Count('id', filter=Q(event_type=TrackingEvent.EventType.CLICK)),
+        unsubscribes=Count('id', filter=Q(event_type=TrackingEvent.EventType.UNSUBSCRIBE)),
+        bounces=Count('id', filter=Q(event_type=TrackingEvent.EventType.BOUNCE)),
+    ).order_by()
+
+    rollups = [
+        TrackingEventHourly(
+            workspace_id=row['campaign_recipient__campaign__workspace_id'],
+            campaign_id=row['campaign_recipient__campaign_id'],
+            hour=row['hour'],
+            opens=row['opens'],
+            clicks=row['clicks'],
+            unsubscribes=row['unsubscribes'],
+            bounces=row['bounces'],
+        )
+        for row in rows.iterator(chunk_size=2000)
+    ]
+
+    TrackingEventHourly.objects.bulk_create(
+        rollups,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=['campaign', 'hour'],
+        update_fields=['opens', 'clicks', 'unsubscribes', 'bounces', 'updated_at'],
+    )
+
+    return {'hours': hours, 'rows': len(rollups)}
@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 
+from celery.schedules import crontab
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,6 +18,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = os.environ.get('SECRET_KEY', 'django-insecure-change-me-in-production')
 
+# Key for encrypted model fields (urlsafe base64 of 32 bytes). Derived from
+# SECRET_KEY when unset; rotating either makes stored credentials unreadable.
+FIELD_ENCRYPTION_KEY = os.environ.get('FIELD_ENCRYPTION_KEY', '')
+
 # Application definition
 DJANGO_APPS = [
     'django.contrib.admin',
@@ -26,6 +31,7 @@ DJANGO_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sites',
+    'django.contrib.postgres',
 ]
 
 THIRD_PARTY_APPS = [
@@ -179,6 +185,21 @@ CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 
 # Celery Beat
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
+# Synced into the database scheduler when beat starts
+CELERY_BEAT_SCHEDULE = {
+    'reset-hourly-email-counters': {
+        'task': 'apps.email_accounts.tasks.reset_hourly_email_counters',
+        'schedule': crontab(minute=0),
+    },
+    'reset-daily-email-counters': {
+        'task': 'apps.email_accounts.tasks.reset_daily_email_counters',
+        'schedule': crontab(minute=0, hour=0),
+    },
+    'rollup-tracking-events': {
+        'task': 'apps.tracking.tasks.rollup_tracking_events',
+        'schedule': crontab(minute='*/15'),
+    },
+}
 
 # Scoring defaults
 SCORE_EMAIL_OPENED = int(os.environ.get('SCORE_EMAIL_OPENED', 5))
@@ -6,6 +6,8 @@ import type {
   EmailAccountLog,
   ConnectionTestResult,
   SendTestEmailRequest,
+  SendTestEmailQueued,
+  SendTestEmailStatus,
 } from '@/types/email-account';
 
 const BASE_PATH = '/email-accounts';
@@ -52,9 +54,15 @@ export const emailAccountsApi = {
     return response.data;
   },
 
-  // Send test email
-  sendTestEmail: async (id: string, data: SendTestEmailRequest): Promise<{ success: boolean; message: string; message_id?: string }> => {
-    const response = await apiClient.post(`${BASE_PATH}/${id}/send_test_email/`, data);
+  // Queue a test email
+  sendTestEmail: async (id: string, data: SendTestEmailRequest): Promise<SendTestEmailQueued> => {
+    const response = await apiClient.post<SendTestEmailQueued>(`${BASE_PATH}/${id}/send_test_email/`, data);
+    return response.data;
+  },
+
+  // Get the outcome of a queued test email
+  getTestEmailStatus: async (id: string, taskId: string): Promise<SendTestEmailStatus> => {
+    const response = await apiClient.get<SendTestEmailStatus>(`${BASE_PATH}/${id}/send_test_email/${taskId}/`);
     return response.data;
   },
 
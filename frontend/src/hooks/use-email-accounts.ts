@@ -85,10 +85,25 @@ export function useTestConnection() {
   });
 }
 
+const TEST_EMAIL_POLL_INTERVAL_MS = 1000;
+const TEST_EMAIL_POLL_ATTEMPTS = 60;
+
+// Queues the test email, then polls until the send has finished
 export function useSendTestEmail() {
   return useMutation({
-    mutationFn: ({ id, data }: { id: string; data: SendTestEmailRequest }) =>
-      emailAccountsApi.sendTestEmail(id, data),
+    mutationFn: async ({ id, data }: { id: string; data: SendTestEmailRequest }) => {
+      const { task_id } = await emailAccountsApi.sendTestEmail(id, data);
+
+      for (let attempt = 0; attempt < TEST_EMAIL_POLL_ATTEMPTS; attempt++) {
+        await new Promise((resolve) => setTimeout(resolve, TEST_EMAIL_POLL_INTERVAL_MS));
+        const result = await emailAccountsApi.getTestEmailStatus(id, task_id);
+        if (result.status !== 'pending') {
+          return { success: result.status === 'sent', message: result.message ?? '' };
+        }
+      }
+
+      return { success: false, message: 'Timed out waiting for the test email to be sent' };
+    },
   });
 }
 
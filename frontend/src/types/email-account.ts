@@ -82,3 +82,16 @@ export interface SendTestEmailRequest {
   subject?: string;
   body?: string;
 }
+
+export interface SendTestEmailQueued {
+  success: boolean;
+  message: string;
+  task_id: string;
+}
+
+export interface SendTestEmailStatus {
+  status: 'pending' | 'sent' | 'failed';
+  success?: boolean;
+  message?: string;
+  message_id?: string | null;
+}